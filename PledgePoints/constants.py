@@ -8,22 +8,25 @@ easy to update pledge lists each semester without modifying code logic.
 Author: Warner (with AI assistance)
 """
 
-from typing import Dict, List
+from typing import Dict, FrozenSet
 
 # =============================================================================
 # PLEDGE CONFIGURATION
 # =============================================================================
 
 # Valid pledge names for the current semester
-# Update this list at the start of each semester
-VALID_PLEDGES: List[str] = [
-    "Ollie",
-    "Scout",
-    "Elliot",
-    "Ethan",
-    "Hayden",
-    "Shaya"
-]
+# Update this set at the start of each semester. It is only used for
+# membership checks, so a frozenset gives constant-time lookups.
+VALID_PLEDGES: FrozenSet[str] = frozenset(
+    {
+        "Ollie",
+        "Scout",
+        "Elliot",
+        "Ethan",
+        "Hayden",
+        "Shaya",
+    }
+)
 
 # Pledge name aliases and nicknames
 # Maps common nicknames or alternate spellings to official pledge names
@@ -44,9 +47,20 @@ EMOJI_FAILURE = "👎"  # Invalid point submission
 # Discord message length limits
 DISCORD_MESSAGE_MAX_LENGTH = 2000  # Official Discord limit
 DISCORD_MESSAGE_SAFE_LENGTH = 1900  # Safe chunking limit with buffer
+DISCORD_MAX_MESSAGE_CHUNKS = 4  # Longer text is sent as a file attachment
+
+# Discord embed limits
+DISCORD_EMBED_MAX_FIELDS = 25  # Fields per embed
+DISCORD_EMBED_MAX_LENGTH = 6000  # Characters across all text in one embed
+DISCORD_EMBED_FIELD_NAME_MAX_LENGTH = 256
+DISCORD_EMBED_FIELD_VALUE_MAX_LENGTH = 1024
+
+# Most pending entries shown in full by /view_pending_points; the rest are counted
+PENDING_LIST_LIMIT = 50
 
 # Rate limiting for Discord API calls
 REACTION_RATE_LIMIT_SECONDS = 0.2  # Minimum time between reactions
+REACTION_CONCURRENCY = 4  # Maximum reactions in flight at once
 
 # =============================================================================
 # VALIDATION CONSTANTS
@@ -1,6 +1,7 @@
 import asyncio
+import logging
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import AsyncIterable, AsyncIterator, List, Tuple
 
 import discord
 import pytz
@@ -8,26 +9,35 @@ import pytz
 from PledgePoints.constants import (
     EMOJI_FAILURE,
     EMOJI_SUCCESS,
+    REACTION_CONCURRENCY,
     REACTION_RATE_LIMIT_SECONDS,
 )
 from PledgePoints.models import PointEntry
-from PledgePoints.sqlutils import DatabaseManager
 from PledgePoints.validators import parse_point_message
 
+logger = logging.getLogger(__name__)
+
 
 async def fetch_messages_from_days_ago(
     bot: discord.Client, channel_id: int, days_ago: int
-) -> list[tuple[discord.User, datetime, str, discord.Message]]:
+) -> AsyncIterator[tuple[discord.User, datetime, str, discord.Message]]:
     """
     Fetch messages from a Discord channel that were sent a certain number of days ago.
 
+    Messages are yielded as they arrive from the channel history rather than
+    collected into a list, so callers can process them while the fetch is
+    still in progress.
+
     Args:
         bot (discord.Client): The Discord bot instance
         channel_id (int): The ID of the channel to fetch messages from
         days_ago (int): Number of days ago to fetch messages from
 
-    Returns:
-        list[tuple[discord.User, datetime, str, discord.Message]]: List of tuples containing (author, created_at, content, message)
+    Yields:
+        tuple[discord.User, datetime, str, discord.Message]: (author, created_at, content, message)
+
+    Raises:
+        ValueError: If the channel cannot be found (raised on first iteration)
     """
     # Get the channel
     channel = bot.get_channel(channel_id)
@@ -37,43 +47,66 @@ async def fetch_messages_from_days_ago(
     # Calculate the target date
     target_date = datetime.now(pytz.UTC) - timedelta(days=days_ago)
 
-    # Fetch messages
-    messages = []
+    # Stream messages
     async for message in channel.history(limit=None, after=target_date):
         # Skip messages from bots
         if message.author.bot:
             continue
-        messages.append((message.author, message.created_at, message.content, message))
-
-    return messages
+        yield message.author, message.created_at, message.content, message
 
 
 async def add_reactions_with_rate_limit(
     messages: List[Tuple[discord.Message, bool]],
     rate_limit: float = REACTION_RATE_LIMIT_SECONDS,
+    concurrency: int = REACTION_CONCURRENCY,
 ):
     """
     Add reactions to messages with rate limiting.
 
     Adds emoji reactions to Discord messages to indicate validation status.
-    Includes rate limiting to avoid hitting Discord API limits.
+    Reactions start at most once every `rate_limit` seconds across the whole
+    batch, paced by one shared lock, so the request rate stays the same as
+    sending them one at a time. Up to `concurrency` reactions may still be in
+    flight at once, so API latency overlaps instead of adding to the pacing.
 
     Args:
         messages: List of (message, success) tuples where success determines emoji
         rate_limit: Minimum time between reactions in seconds
+        concurrency: Maximum number of reactions sent concurrently
     """
-    for message, success in messages:
-        try:
+    semaphore = asyncio.Semaphore(concurrency)
+    pacing = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def react(message: discord.Message, success: bool):
+        nonlocal next_start
+        async with semaphore:
+            # Wait for this reaction's turn; holding the lock while sleeping
+            # keeps starts at least rate_limit apart across every slot
+            async with pacing:
+                delay = next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = loop.time() + rate_limit
             emoji = EMOJI_SUCCESS if success else EMOJI_FAILURE
             await message.add_reaction(emoji)
-            await asyncio.sleep(rate_limit)  # Rate limit the reactions
-        except Exception:
-            # Skip if we can't add the reaction (permissions, deleted message, etc.)
-            continue
+
+    # Failures (permissions, deleted message, etc.) are returned rather than
+    # raised so one bad message doesn't stop the rest of the batch
+    results = await asyncio.gather(
+        *(react(message, success) for message, success in messages),
+        return_exceptions=True,
+    )
+    for (message, _), result in zip(messages, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Could not add reaction to message %s: %s", message.id, result
+            )
 
 
 async def process_messages(
-    messages: list[tuple[discord.User, datetime, str, discord.Message]],
+    messages: AsyncIterable[tuple[discord.User, datetime, str, discord.Message]],
 ) -> List[PointEntry]:
     """
     Process messages to extract point changes, pledge names, and comments.
@@ -83,7 +116,8 @@ async def process_messages(
     to messages (thumbs up for valid, thumbs down for invalid).
 
     Args:
-        messages: List of tuples containing (author, timestamp, content, message)
+        messages: Async iterable of tuples containing (author, timestamp, content, message),
+                  such as the generator returned by fetch_messages_from_days_ago
 
     Returns:
         List[PointEntry]: List of validated point entries ready for database insertion
@@ -91,7 +125,7 @@ async def process_messages(
     processed_entries = []
     reaction_queue = []
 
-    for author, timestamp, content, message in messages:
+    async for author, timestamp, content, message in messages:
         # Use centralized validator to parse message
         result = parse_point_message(content)
 
@@ -117,54 +151,3 @@ async def process_messages(
     asyncio.create_task(add_reactions_with_rate_limit(reaction_queue))
 
     return processed_entries
-
-
-def eliminate_duplicates(
-    new_entries: List[PointEntry],
-    db_manager: DatabaseManager,
-) -> List[PointEntry]:
-    """
-    Eliminate duplicate point entries by comparing against existing database entries.
-
-    Compares new entries against all existing entries (pending, approved, rejected)
-    to avoid duplicate insertions. Uses ISO format for datetime comparison to
-    preserve full precision including microseconds and timezone information.
-
-    Args:
-        new_entries: List of new point entries to check for duplicates
-        db_manager: Database manager instance for querying existing entries
-
-    Returns:
-        List[PointEntry]: List of unique entries not already in the database
-    """
-    # Get all existing points from the database, regardless of approval status
-    # We only compare message content (time, points, pledge, comment)
-    # and ignore approval-related fields (id, approval_status, approved_by, approval_timestamp)
-    # NOTE: We also ignore the 'brother' field because Discord display names can change
-    old_points = db_manager.get_all_points(status_filter=None)
-
-    # Convert old points to a set of string representations for faster lookup
-    # NOTE: We exclude the 'brother' field from comparison because Discord display names
-    # can change over time, causing the same message to appear as a duplicate with a
-    # different brother name. The unique identifier should be the message itself
-    # (time + pledge + points + comment), not who recorded it.
-    old_points_set = set()
-    for point in old_points:
-        # Convert datetime to ISO format string to preserve full precision
-        time_str = point.time.isoformat()
-        # Create a tuple of the relevant fields as strings (excluding brother)
-        point_key = (time_str, str(point.point_change), point.pledge, point.comment)
-        old_points_set.add(point_key)
-
-    # Filter new entries
-    unique_entries = []
-    for entry in new_entries:
-        # Convert datetime to ISO format string in the same format
-        time_str = entry.time.isoformat()
-        # Create a tuple of the relevant fields as strings (excluding brother)
-        entry_key = (time_str, str(entry.point_change), entry.pledge, entry.comment)
-
-        if entry_key not in old_points_set:
-            unique_entries.append(entry)
-
-    return unique_entries
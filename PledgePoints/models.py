@@ -9,10 +9,28 @@ Author: Warner (with AI assistance)
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Union
 
 
-@dataclass
+def _to_datetime(value: Union[str, datetime]) -> datetime:
+    """
+    Convert a stored timestamp to a datetime.
+
+    Args:
+        value: ISO format timestamp string, or an existing datetime
+
+    Returns:
+        datetime: Parsed datetime (or the value itself if already a datetime)
+
+    Raises:
+        ValueError: If the string is not a valid ISO format timestamp
+    """
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class PointEntry:
     """
     Represents a single point entry in the pledge points system.
@@ -21,6 +39,12 @@ class PointEntry:
     including the time it occurred, the point change, which pledge and brother
     were involved, and any associated comment.
 
+    Instances use ``__slots__`` instead of a per-instance ``__dict__`` since one
+    is created for every Discord message processed during an update. The class
+    is deliberately not frozen: frozen dataclasses assign every field through
+    ``object.__setattr__`` in ``__init__``, which makes construction several
+    times slower.
+
     Attributes:
         time (datetime): When the point entry was created
         point_change (int): The number of points (positive or negative)
@@ -77,22 +101,25 @@ class PointEntry:
             approval_timestamp_str,
         ) = row
 
-        # Convert time string to datetime
-        if isinstance(time_str, datetime):
-            time_dt = time_str
-        else:
+        # SQLite hands back timestamps as strings, so check for exactly str
+        # first and only fall back to the general conversion otherwise
+        if type(time_str) is str:
             time_dt = datetime.fromisoformat(time_str)
+        else:
+            time_dt = _to_datetime(time_str)
 
-        # Convert approval timestamp if present
+        # Convert approval timestamp if present; invalid values become None.
+        # Stored values are almost always valid, so parse directly rather than
+        # pre-validating with a regex: try costs nothing unless it raises.
         approval_dt = None
-        if approval_timestamp_str:
-            if isinstance(approval_timestamp_str, datetime):
-                approval_dt = approval_timestamp_str
-            else:
+        if type(approval_timestamp_str) is str:
+            if approval_timestamp_str:
                 try:
                     approval_dt = datetime.fromisoformat(approval_timestamp_str)
-                except (ValueError, TypeError):
+                except ValueError:
                     pass
+        elif isinstance(approval_timestamp_str, datetime):
+            approval_dt = approval_timestamp_str
 
         return cls(
             time=time_dt,
@@ -106,6 +133,41 @@ class PointEntry:
             approval_timestamp=approval_dt,
         )
 
+    @classmethod
+    def from_db_rows(cls, rows: Iterable[tuple]) -> List["PointEntry"]:
+        """
+        Create PointEntry objects from many database rows.
+
+        Accepts any iterable of rows in from_db_row's column order, including a
+        cursor, so rows are converted as they are fetched. Rows that can't be
+        converted (e.g. an invalid time) are skipped. Entries with the same
+        pledge or brother name share a single string for it.
+
+        Args:
+            rows (Iterable[tuple]): Database rows to convert
+
+        Returns:
+            List[PointEntry]: Entries for every row that could be converted
+        """
+        entries = []
+        # Pledge and brother names repeat on almost every row, but SQLite
+        # returns a new str for each one; keep one shared copy of each name
+        names: Dict[str, str] = {}
+        # Bind lookups once outside the loop
+        append = entries.append
+        from_db_row = cls.from_db_row
+        share = names.setdefault
+        for row in rows:
+            try:
+                entry = from_db_row(row)
+            except (ValueError, TypeError):
+                # Skip rows that can't be converted
+                continue
+            entry.pledge = share(entry.pledge, entry.pledge)
+            entry.brother = share(entry.brother, entry.brother)
+            append(entry)
+        return entries
+
     @classmethod
     def from_simple_row(cls, row: tuple) -> "PointEntry":
         """
@@ -120,10 +182,7 @@ class PointEntry:
         time_str, point_change, pledge, brother, comment = row
 
         # Convert time string to datetime
-        if isinstance(time_str, datetime):
-            time_dt = time_str
-        else:
-            time_dt = datetime.fromisoformat(time_str)
+        time_dt = _to_datetime(time_str)
 
         return cls(
             time=time_dt,
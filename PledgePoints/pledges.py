@@ -1,18 +1,61 @@
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
 from pandas import DataFrame
-import seaborn as sns
 
+from PledgePoints.constants import VALID_PLEDGES
 from PledgePoints.sqlutils import DatabaseManager
 
+# matplotlib and seaborn are slow to import, so they're only loaded when a
+# plot is actually drawn
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Figure reused by every plot_rankings call, created on first use
+_rankings_figure: Optional["Figure"] = None
+
+
+def _get_rankings_axes(n_pledges: int) -> "Axes":
+    """
+    Return cleared axes on the shared rankings figure, sized for the pledge count.
+
+    Reusing one Agg-backed figure avoids creating and tearing down a pyplot
+    figure every time rankings are plotted.
+
+    Args:
+        n_pledges (int): Number of bars that will be drawn
+
+    Returns:
+        Axes: Empty axes ready to draw on
+    """
+    global _rankings_figure
+    size = (max(6, n_pledges * 0.7), 6)
+    if _rankings_figure is None:
+        import seaborn as sns
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        sns.set_theme(style="whitegrid")
+        _rankings_figure = Figure(figsize=size)
+        FigureCanvasAgg(_rankings_figure)
+        return _rankings_figure.add_subplot()
+
+    _rankings_figure.set_size_inches(*size)
+    ax = _rankings_figure.axes[0]
+    ax.clear()
+    return ax
+
 
 def get_pledge_points(db_manager: DatabaseManager) -> DataFrame:
     """
     Fetches and processes approved pledge points data from the database.
 
-    Retrieves only approved point entries and converts them into a pandas
-    DataFrame for analysis. The data is sorted by time in descending order
-    (most recent first).
+    Reads only approved point entries straight into a pandas DataFrame for
+    analysis, without building a PointEntry per row. Rows whose Time can't be
+    parsed are dropped. The data is sorted by time in descending order (most
+    recent first).
 
     Args:
         db_manager: DatabaseManager instance for accessing the database
@@ -20,33 +63,29 @@ def get_pledge_points(db_manager: DatabaseManager) -> DataFrame:
     Returns:
         DataFrame: A pandas DataFrame containing approved pledge points
         with columns ['Time', 'PointChange', 'Pledge', 'Brother', 'Comment'].
-        Sorted by Time in descending order.
+        PointChange uses the smallest signed integer dtype that holds every
+        value. Sorted by Time in descending order.
     """
-    # Get approved points using the database manager
-    approved_entries = db_manager.get_approved_points()
-
-    # Convert PointEntry objects to DataFrame
-    data = []
-    for entry in approved_entries:
-        data.append(
-            {
-                "Time": entry.time,
-                "PointChange": entry.point_change,
-                "Pledge": entry.pledge,
-                "Brother": entry.brother,
-                "Comment": entry.comment,
-            }
-        )
-
-    df = pd.DataFrame(data)
+    df = pd.read_sql_query(
+        """
+        SELECT Time, PointChange, Pledge, Brother, Comment
+        FROM Points
+        WHERE approval_status = 'approved'
+        """,
+        db_manager.get_read_connection(),
+    )
 
     # Handle empty dataframe case
     if df.empty:
         return df
 
-    # Ensure Time is datetime and sort
-    df["Time"] = pd.to_datetime(df["Time"])
-    df = df.sort_values(by="Time", ascending=False)
+    # Parse Time in one vectorised pass, skipping rows that can't be converted
+    df["Time"] = pd.to_datetime(df["Time"], format="ISO8601", errors="coerce")
+    df = df.dropna(subset=["Time"])
+    # Point changes are small, so store them in the narrowest signed int that
+    # fits; rank_pledges sums in wider types, so totals can't overflow
+    df["PointChange"] = pd.to_numeric(df["PointChange"], downcast="signed")
+    df = df.sort_values(by="Time", ascending=False, ignore_index=True)
     return df
 
 
@@ -54,10 +93,11 @@ def rank_pledges(df: DataFrame) -> pd.Series:
     """
     Ranks pledges by the sum of associated point changes in descending order.
 
-    This function groups the provided DataFrame by the 'Pledge' column, sums the
-    'PointChange' values for each group, and sorts the results in descending order of
-    the summed values. The ranking highlights the pledges with the highest cumulative
-    point changes.
+    This function encodes the 'Pledge' column as categorical codes and sums the
+    'PointChange' values for each pledge with a single weighted `np.bincount`,
+    then sorts the results in descending order of the summed values. Pledges
+    with equal totals are ordered alphabetically. The ranking highlights the
+    pledges with the highest cumulative point changes.
 
     Args:
         df (DataFrame): Input DataFrame containing at least the following columns:
@@ -68,29 +108,73 @@ def rank_pledges(df: DataFrame) -> pd.Series:
         pd.Series: A Series indexed by pledge, with values representing the cumulative
         point changes sorted in descending order.
     """
-    return df.groupby("Pledge")["PointChange"].sum().sort_values(ascending=False)
+    if df.empty:
+        return pd.Series(
+            dtype="int64", name="PointChange", index=pd.Index([], name="Pledge")
+        )
 
+    pledges = pd.Categorical(df["Pledge"])
+    values = df["PointChange"].to_numpy()
+
+    # Rows without a pledge have code -1; leave them out like groupby does
+    has_pledge = pledges.codes >= 0
+    totals = np.bincount(
+        pledges.codes[has_pledge],
+        weights=values[has_pledge],
+        minlength=len(pledges.categories),
+    )
+    # bincount sums in float64; integer points are exact, so restore the int dtype
+    if values.dtype.kind in "iu":
+        totals = totals.astype("int64")
+
+    order = np.argsort(-totals, kind="stable")
+    return pd.Series(
+        totals[order],
+        index=pd.Index(pledges.categories[order], name="Pledge"),
+        name="PointChange",
+    )
+
+
+def filter_valid_pledges(rankings: pd.Series) -> pd.Series:
+    """
+    Keep only the rankings for pledges in VALID_PLEDGES.
+
+    Former pledges stay in the database, so rankings are filtered to the
+    current semester before they're shown. Ranking order is preserved.
 
-def plot_rankings(rankings: pd.Series) -> str:
+    Args:
+        rankings (pd.Series): Rankings indexed by pledge name, as returned
+            by rank_pledges.
+
+    Returns:
+        pd.Series: The rankings for current pledges only.
+    """
+    return rankings[rankings.index.isin(VALID_PLEDGES)]
+
+
+def plot_rankings(rankings: pd.Series, path: str = "rankings.png") -> str:
     """
     Generate a bar plot of rankings and save it as an image file.
 
     This function takes a pandas Series representing rankings data
     and creates a bar plot using the Seaborn library. The plot
     displays pledges on the x-axis and their corresponding total
-    points on the y-axis. The function saves the plot to a PNG
-    file named 'rankings.png' in the current directory and
-    returns the filename.
+    points on the y-axis. The same figure is cleared and redrawn on
+    every call. The function saves the plot as a PNG file at ``path``
+    (by default 'rankings.png' in the current directory) and returns
+    the filename.
 
     Args:
         rankings (pd.Series): A pandas Series object where the
             index represents the pledges and the values represent
             their corresponding total points.
+        path (str): Where to save the image.
 
     Returns:
         str: The filename of the saved bar plot image.
     """
-    sns.set_theme(style="whitegrid")
+    import seaborn as sns
+
     # Convert to DataFrame to ensure order is preserved and explicit
     df = rankings.reset_index()
     df.columns = ["Pledge", "TotalPoints"]
@@ -98,13 +182,14 @@ def plot_rankings(rankings: pd.Series) -> str:
     df = df.sort_values("TotalPoints", ascending=False, ignore_index=True)
     # Use categorical ordering to ensure correct plotting order
     df["Pledge"] = pd.Categorical(df["Pledge"], categories=df["Pledge"], ordered=True)
-    plt.figure(figsize=(max(6, len(df) * 0.7), 6))
-    sns.barplot(x="Pledge", y="TotalPoints", data=df, order=df["Pledge"])
-    plt.title("Pledge Rankings by Total Points")
-    plt.xlabel("Pledge")
-    plt.ylabel("Total Points")
-    plt.xticks(rotation=45, ha="right", fontsize=10)
-    plt.tight_layout()
-    plt.savefig("rankings.png")
-    plt.close()
-    return "rankings.png"
+    ax = _get_rankings_axes(len(df))
+    sns.barplot(x="Pledge", y="TotalPoints", data=df, order=df["Pledge"], ax=ax)
+    ax.set_title("Pledge Rankings by Total Points")
+    ax.set_xlabel("Pledge")
+    ax.set_ylabel("Total Points")
+    ax.set_xticks(
+        ax.get_xticks(), ax.get_xticklabels(), rotation=45, ha="right", fontsize=10
+    )
+    ax.figure.tight_layout()
+    ax.figure.savefig(path)
+    return path
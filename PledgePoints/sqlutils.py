@@ -9,12 +9,76 @@ Author: Warner (with AI assistance)
 """
 
 import sqlite3
+import uuid
 from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 from PledgePoints.models import PointEntry
 
+# Per-connection settings applied by get_connection. With WAL journaling,
+# synchronous=NORMAL only syncs at checkpoints instead of on every commit and
+# still can't corrupt the database. sqlite3.connect already sets a 5 second
+# busy timeout.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+"""
+
+# Rows per multi-row INSERT. Each row binds 5 parameters, which keeps every
+# statement under SQLite's historical limit of 999 parameters.
+_INSERT_CHUNK_ROWS = 999 // 5
+
+
+def _db_time(value: datetime) -> str:
+    """
+    Format a datetime the way the Points table stores it.
+
+    Every write and every Time comparison goes through this, so matching Time
+    by text (as insert_if_new does) compares like with like. The form is the
+    one sqlite3's default datetime adapter produced for existing rows.
+
+    Args:
+        value (datetime): Timestamp to store or compare against
+
+    Returns:
+        str: ISO 8601 text with a space between date and time
+    """
+    return value.isoformat(" ")
+
+
+def _db_params(entry: PointEntry) -> tuple:
+    """
+    Return the values bound for a point entry's row in the Points table.
+
+    Args:
+        entry (PointEntry): Entry to store
+
+    Returns:
+        tuple: (Time, PointChange, Pledge, Brother, Comment)
+    """
+    return (_db_time(entry.time),) + entry.to_tuple()[1:]
+
+
+@lru_cache(maxsize=None)
+def _insert_points_sql(row_count: int) -> str:
+    """
+    Build an INSERT statement that adds row_count pending point entries.
+
+    Args:
+        row_count (int): Number of rows in the VALUES list
+
+    Returns:
+        str: Parameterized INSERT statement taking 5 parameters per row
+    """
+    values = ",".join(["(?, ?, ?, ?, ?, 'pending')"] * row_count)
+    return (
+        "INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment, "
+        f"approval_status) VALUES {values}"
+    )
+
 
 class DatabaseManager:
     """
@@ -24,18 +88,39 @@ class DatabaseManager:
     for CRUD operations on point entries. It uses context managers to ensure
     proper connection handling and resource cleanup.
 
+    Read-only queries share one long-lived connection, while each write opens
+    its own connection and transaction through get_connection.
+
+    Pending entries are cached between writes, since the pending list is read
+    far more often than it changes. Every method that modifies the Points table
+    invalidates the cache. The cache only sees writes made through this
+    manager, so the bot uses a single DatabaseManager per database.
+
     Attributes:
-        db_file (str): Path to the SQLite database file
+        db_file (str): Path or SQLite URI of the database file
     """
 
     def __init__(self, db_file: str):
         """
         Initialize the database manager.
 
+        Passing ":memory:" creates a private in-memory database that lives as
+        long as this manager, which is useful for tests.
+
         Args:
-            db_file (str): Path to the SQLite database file
+            db_file (str): Path to the SQLite database file, ":memory:", or a
+                           "file:" URI
         """
         self.db_file = db_file
+        self._keepalive: Optional[sqlite3.Connection] = None
+        if db_file == ":memory:":
+            # Every connection to ":memory:" gets its own empty database, so use a
+            # uniquely named shared-cache database instead and hold one connection
+            # open to keep it alive between operations
+            self.db_file = f"file:deltap-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._keepalive = sqlite3.connect(self.db_file, uri=True)
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._pending_cache: Optional[List[PointEntry]] = None
         self._ensure_initialized()
 
     @contextmanager
@@ -54,16 +139,55 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM Points")
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = sqlite3.connect(self.db_file, uri=True)
+        conn.executescript(_CONNECTION_PRAGMAS)
         try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+            # The connection's own context manager commits on success and
+            # rolls back if an exception escapes
+            with conn:
+                yield conn
         finally:
             conn.close()
 
+    def get_read_connection(self) -> sqlite3.Connection:
+        """
+        Return the connection shared by read-only queries, opening it on first use.
+
+        Reads never start a transaction, so each query sees everything committed
+        before it. Reusing one connection skips the connect cost and keeps
+        SQLite's page cache warm between reads. Writes still go through
+        get_connection. Callers must only read through it and leave closing it
+        to close().
+
+        Returns:
+            sqlite3.Connection: Connection for read-only queries
+        """
+        if self._read_conn is None:
+            self._read_conn = sqlite3.connect(self.db_file, uri=True)
+            self._read_conn.executescript(_CONNECTION_PRAGMAS)
+        return self._read_conn
+
+    def close(self):
+        """
+        Close the connections this manager keeps open between operations.
+
+        Closes the shared read connection and, for ":memory:" databases, the
+        connection keeping the database alive, so an in-memory database is
+        discarded. Call this once the manager is no longer needed, e.g. when
+        the bot shuts down. Safe to call more than once.
+        """
+        self._pending_cache = None
+        if self._read_conn is not None:
+            self._read_conn.close()
+            self._read_conn = None
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
+    def _invalidate_pending_cache(self):
+        """Drop the cached pending entries so the next read hits the database."""
+        self._pending_cache = None
+
     def _ensure_initialized(self):
         """
         Ensure the database is initialized with the required schema.
@@ -74,6 +198,11 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            # WAL lets readers and a writer work concurrently and makes commits
+            # cheaper. The mode is stored in the database file, so it only needs
+            # setting once; in-memory databases keep their own journal mode.
+            cursor.execute("PRAGMA journal_mode = WAL")
+
             # Create the Points table if it doesn't exist
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS Points (
@@ -90,18 +219,31 @@ class DatabaseManager:
             """)
 
             # Add new columns to existing table if they don't exist
-            # Note: SQLite doesn't support "ADD COLUMN IF NOT EXISTS"
-            # so we need to handle errors for existing columns
-            for column_def in [
-                "approval_status TEXT DEFAULT 'pending'",
-                "approved_by TEXT",
-                "approval_timestamp TEXT",
+            # Note: SQLite doesn't support "ADD COLUMN IF NOT EXISTS", so look
+            # up the current columns first and only alter a table that needs it
+            cursor.execute("PRAGMA table_info(Points)")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            for column_name, column_def in [
+                ("approval_status", "approval_status TEXT DEFAULT 'pending'"),
+                ("approved_by", "approved_by TEXT"),
+                ("approval_timestamp", "approval_timestamp TEXT"),
             ]:
-                try:
+                if column_name not in existing_columns:
                     cursor.execute(f"ALTER TABLE Points ADD COLUMN {column_def}")
-                except sqlite3.OperationalError:
-                    # Column already exists, continue
-                    pass
+
+            # Index the fields that identify a message so duplicate checks
+            # are index seeks instead of table scans
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_points_message
+                ON Points (Time, PointChange, Pledge, Comment)
+            """)
+
+            # Index approval status so the pending list (a small slice of the
+            # table once points pile up) doesn't need a full table scan
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_points_status
+                ON Points (approval_status)
+            """)
 
     def add_point_entries(self, entries: List[PointEntry]) -> int:
         """
@@ -115,17 +257,71 @@ class DatabaseManager:
         Returns:
             int: Number of entries added
         """
+        if not entries:
+            return 0
+
+        self._invalidate_pending_cache()
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # Convert entries to tuples for bulk insert
-            values = [entry.to_tuple() for entry in entries]
-            cursor.executemany(
-                """INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment, approval_status)
-                   VALUES (?, ?, ?, ?, ?, 'pending')""",
-                values,
-            )
+            # Insert in multi-row chunks, which crosses into SQLite far less
+            # often than executemany's one row per step; everything runs in a
+            # single transaction
+            for start in range(0, len(entries), _INSERT_CHUNK_ROWS):
+                chunk = entries[start : start + _INSERT_CHUNK_ROWS]
+                cursor.execute(
+                    _insert_points_sql(len(chunk)),
+                    [value for entry in chunk for value in _db_params(entry)],
+                )
             return len(entries)
 
+    def insert_if_new(self, entries: List[PointEntry]) -> List[PointEntry]:
+        """
+        Add point entries that are not already in the database.
+
+        An entry is a duplicate if an existing row (in any approval status) has
+        the same time, point change, pledge and comment. The brother is ignored
+        because Discord display names can change. The check and the insert
+        happen in a single transaction, so no duplicate can slip in between them.
+
+        Time is matched as stored text, which relies on every write formatting
+        it with _db_time. Timestamps with different UTC offsets are therefore
+        different messages, even if they name the same instant.
+
+        Args:
+            entries (List[PointEntry]): List of point entries to add
+
+        Returns:
+            List[PointEntry]: The entries that were inserted, with entry_id set
+        """
+        if not entries:
+            return []
+
+        self._invalidate_pending_cache()
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            inserted_entries = []
+            for entry in entries:
+                params = _db_params(entry)
+                cursor.execute(
+                    """
+                    INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment, approval_status)
+                    SELECT ?, ?, ?, ?, ?, 'pending'
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM Points
+                        WHERE Time = ? AND PointChange = ? AND Pledge = ? AND Comment = ?
+                    )
+                    RETURNING id
+                """,
+                    params + (params[0], params[1], params[2], params[4]),
+                )
+                row = cursor.fetchone()
+                if row:
+                    inserted_entries.append(replace(entry, entry_id=row[0]))
+
+            return inserted_entries
+
     def get_all_points(
         self, status_filter: Optional[List[str]] = None
     ) -> List[PointEntry]:
@@ -140,37 +336,23 @@ class DatabaseManager:
         Returns:
             List[PointEntry]: List of point entries matching the filter
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        cursor = self.get_read_connection().cursor()
 
-            if status_filter:
-                # Build parameterized query with placeholders
-                placeholders = ",".join("?" for _ in status_filter)
-                query = f"""
-                    SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                           approval_status, approved_by, approval_timestamp
-                    FROM Points
-                    WHERE approval_status IN ({placeholders})
-                """
-                cursor.execute(query, status_filter)
-            else:
-                cursor.execute("""
-                    SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                           approval_status, approved_by, approval_timestamp
-                    FROM Points
-                """)
-
-            rows = cursor.fetchall()
-            # Convert rows to PointEntry objects, skipping any that fail to parse
-            entries = []
-            for row in rows:
-                try:
-                    entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    # Skip rows that can't be converted
-                    continue
-
-            return entries
+        query = """
+            SELECT id, Time, PointChange, Pledge, Brother, Comment,
+                   approval_status, approved_by, approval_timestamp
+            FROM Points
+        """
+        params: List[str] = []
+        if status_filter:
+            # Build parameterized query with placeholders
+            placeholders = ",".join("?" for _ in status_filter)
+            query += f" WHERE approval_status IN ({placeholders})"
+            params.extend(status_filter)
+        cursor.execute(query, params)
+
+        # Convert rows to PointEntry objects, skipping any that fail to parse
+        return PointEntry.from_db_rows(cursor)
 
     def get_approved_points(self) -> List[PointEntry]:
         """
@@ -185,10 +367,17 @@ class DatabaseManager:
         """
         Get only pending point entries.
 
+        The result is cached until the next write through this manager. Writes
+        made through another DatabaseManager or connection are not seen until
+        then, so this assumes one manager per database. Callers get copies of
+        the cached entries and may modify them freely.
+
         Returns:
             List[PointEntry]: List of pending point entries
         """
-        return self.get_all_points(status_filter=["pending"])
+        if self._pending_cache is None:
+            self._pending_cache = self.get_all_points(status_filter=["pending"])
+        return [replace(entry) for entry in self._pending_cache]
 
     def get_point_by_id(self, point_id: int) -> Optional[PointEntry]:
         """
@@ -200,30 +389,83 @@ class DatabaseManager:
         Returns:
             Optional[PointEntry]: The point entry if found, None otherwise
         """
+        entries = self.get_points_by_ids([point_id])
+        return entries[0] if entries else None
+
+    def get_points_by_ids(self, point_ids: List[int]) -> List[PointEntry]:
+        """
+        Retrieve several point entries by their IDs with a single query.
+
+        IDs that don't exist, or whose rows can't be parsed, are left out.
+
+        Args:
+            point_ids (List[int]): Database IDs of the point entries
+
+        Returns:
+            List[PointEntry]: The matching point entries, ordered by ID
+        """
+        if not point_ids:
+            return []
+
+        cursor = self.get_read_connection().cursor()
+        placeholders = ",".join("?" for _ in point_ids)
+        cursor.execute(
+            f"""
+            SELECT id, Time, PointChange, Pledge, Brother, Comment,
+                   approval_status, approved_by, approval_timestamp
+            FROM Points
+            WHERE id IN ({placeholders})
+            ORDER BY id
+        """,
+            point_ids,
+        )
+
+        return PointEntry.from_db_rows(cursor)
+
+    def _update_status(
+        self, assignments: str, where: str, params: list
+    ) -> List[PointEntry]:
+        """
+        Update matching entries and return them as they are after the update.
+
+        Uses UPDATE ... RETURNING, so the rows are changed and read back in a
+        single statement, and the returned entries are exactly the ones updated.
+
+        Args:
+            assignments (str): SET clause, e.g. "approval_status = 'approved'"
+            where (str): WHERE clause selecting the rows to update
+            params (list): Parameters for the placeholders in assignments and
+                           where, in that order
+
+        Returns:
+            List[PointEntry]: Updated entries, ordered by ID
+        """
+        self._invalidate_pending_cache()
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id = ?
+                f"""
+                UPDATE Points
+                SET {assignments}
+                WHERE {where}
+                RETURNING id, Time, PointChange, Pledge, Brother, Comment,
+                          approval_status, approved_by, approval_timestamp
             """,
-                (point_id,),
+                params,
             )
+            updated_entries = PointEntry.from_db_rows(cursor)
 
-            row = cursor.fetchone()
-            if row:
-                try:
-                    return PointEntry.from_db_row(row)
-                except (ValueError, TypeError):
-                    return None
-            return None
+        # SQLite doesn't guarantee the order of RETURNING rows
+        updated_entries.sort(key=lambda entry: entry.entry_id)
+        return updated_entries
 
     def approve_points(self, point_ids: List[int], approver: str) -> List[PointEntry]:
         """
         Approve specific point entries by their IDs.
 
+        Only pending entries are approved; other IDs are ignored.
+
         Args:
             point_ids (List[int]): List of point entry IDs to approve
             approver (str): Name of the person approving the points
@@ -234,43 +476,12 @@ class DatabaseManager:
         if not point_ids:
             return []
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
-
-            # Get the entries that will be approved
-            placeholders = ",".join("?" for _ in point_ids)
-            cursor.execute(
-                f"""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                point_ids,
-            )
-
-            rows = cursor.fetchall()
-            approved_entries = []
-            for row in rows:
-                try:
-                    approved_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
-
-            # Update approval status
-            cursor.execute(
-                f"""
-                UPDATE Points
-                SET approval_status = 'approved',
-                    approved_by = ?,
-                    approval_timestamp = ?
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                [approver, current_time] + point_ids,
-            )
-
-            return approved_entries
+        placeholders = ",".join("?" for _ in point_ids)
+        return self._update_status(
+            "approval_status = 'approved', approved_by = ?, approval_timestamp = ?",
+            f"id IN ({placeholders}) AND approval_status = 'pending'",
+            [approver, datetime.now().isoformat()] + list(point_ids),
+        )
 
     def approve_all_pending(self, approver: str) -> List[PointEntry]:
         """
@@ -282,42 +493,11 @@ class DatabaseManager:
         Returns:
             List[PointEntry]: List of all approved point entries
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
-
-            # Get all pending entries
-            cursor.execute("""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE approval_status = 'pending'
-            """)
-
-            rows = cursor.fetchall()
-            approved_entries = []
-            for row in rows:
-                try:
-                    approved_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
-
-            if not approved_entries:
-                return []
-
-            # Update all pending to approved
-            cursor.execute(
-                """
-                UPDATE Points
-                SET approval_status = 'approved',
-                    approved_by = ?,
-                    approval_timestamp = ?
-                WHERE approval_status = 'pending'
-            """,
-                (approver, current_time),
-            )
-
-            return approved_entries
+        return self._update_status(
+            "approval_status = 'approved', approved_by = ?, approval_timestamp = ?",
+            "approval_status = 'pending'",
+            [approver, datetime.now().isoformat()],
+        )
 
     def reset_points_to_pending(self, point_ids: List[int]) -> List[PointEntry]:
         """
@@ -332,52 +512,20 @@ class DatabaseManager:
         if not point_ids:
             return []
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            placeholders = ",".join("?" for _ in point_ids)
-            cursor.execute(
-                f"""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id IN ({placeholders})
-            """,
-                point_ids,
-            )
-
-            rows = cursor.fetchall()
-            pending_entries = []
-            for row in rows:
-                try:
-                    entry = PointEntry.from_db_row(row)
-                    entry.approval_status = "pending"
-                    entry.approved_by = None
-                    entry.approval_timestamp = None
-                    pending_entries.append(entry)
-                except (ValueError, TypeError):
-                    continue
-
-            if not pending_entries:
-                return []
-
-            cursor.execute(
-                f"""
-                UPDATE Points
-                SET approval_status = 'pending',
-                    approved_by = NULL,
-                    approval_timestamp = NULL
-                WHERE id IN ({placeholders})
-            """,
-                point_ids,
-            )
-
-            return pending_entries
+        placeholders = ",".join("?" for _ in point_ids)
+        return self._update_status(
+            "approval_status = 'pending', approved_by = NULL, "
+            "approval_timestamp = NULL",
+            f"id IN ({placeholders})",
+            list(point_ids),
+        )
 
     def reject_points(self, point_ids: List[int], rejector: str) -> List[PointEntry]:
         """
         Reject specific point entries by their IDs.
 
+        Only pending entries are rejected; other IDs are ignored.
+
         Args:
             point_ids (List[int]): List of point entry IDs to reject
             rejector (str): Name of the person rejecting the points
@@ -388,43 +536,12 @@ class DatabaseManager:
         if not point_ids:
             return []
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
-
-            # Get the entries that will be rejected
-            placeholders = ",".join("?" for _ in point_ids)
-            cursor.execute(
-                f"""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                point_ids,
-            )
-
-            rows = cursor.fetchall()
-            rejected_entries = []
-            for row in rows:
-                try:
-                    rejected_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
-
-            # Update approval status
-            cursor.execute(
-                f"""
-                UPDATE Points
-                SET approval_status = 'rejected',
-                    approved_by = ?,
-                    approval_timestamp = ?
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                [rejector, current_time] + point_ids,
-            )
-
-            return rejected_entries
+        placeholders = ",".join("?" for _ in point_ids)
+        return self._update_status(
+            "approval_status = 'rejected', approved_by = ?, approval_timestamp = ?",
+            f"id IN ({placeholders}) AND approval_status = 'pending'",
+            [rejector, datetime.now().isoformat()] + list(point_ids),
+        )
 
     def reject_all_pending(self, rejector: str) -> List[PointEntry]:
         """
@@ -436,46 +553,8 @@ class DatabaseManager:
         Returns:
             List[PointEntry]: List of all rejected point entries
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
-
-            # Get all pending entries
-            cursor.execute("""
-                           SELECT id,
-                                  Time,
-                                  PointChange,
-                                  Pledge,
-                                  Brother,
-                                  Comment,
-                                  approval_status,
-                                  approved_by,
-                                  approval_timestamp
-                           FROM Points
-                           WHERE approval_status = 'pending'
-                           """)
-
-            rows = cursor.fetchall()
-            rejected_entries = []
-            for row in rows:
-                try:
-                    rejected_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
-
-            if not rejected_entries:
-                return []
-
-            # Update all pending to rejected
-            cursor.execute(
-                """
-                           UPDATE Points
-                           SET approval_status    = 'rejected',
-                               approved_by        = ?,
-                               approval_timestamp = ?
-                           WHERE approval_status = 'pending'
-                           """,
-                (rejector, current_time),
-            )
-
-            return rejected_entries
+        return self._update_status(
+            "approval_status = 'rejected', approved_by = ?, approval_timestamp = ?",
+            "approval_status = 'pending'",
+            [rejector, datetime.now().isoformat()],
+        )
@@ -8,6 +8,7 @@ Author: Warner (with AI assistance)
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from PledgePoints.constants import (
@@ -18,6 +19,9 @@ from PledgePoints.constants import (
     VALID_PLEDGES,
 )
 
+# Compiled once at import since every fetched Discord message is parsed
+_POINT_REGEX = re.compile(POINT_REGEX_PATTERN)
+
 
 def validate_point_change(value: int) -> bool:
     """
@@ -34,12 +38,14 @@ def validate_point_change(value: int) -> bool:
     return SQL_INT_MIN <= value <= SQL_INT_MAX
 
 
+@lru_cache(maxsize=256)
 def normalize_pledge_name(name: str) -> str:
     """
     Normalize a pledge name using title case and alias mapping.
 
     Converts the name to title case and applies any configured aliases
-    (e.g., "Matt" → "Matthew", "Ozempic" → "Eli").
+    (e.g., "Matt" → "Matthew", "Ozempic" → "Eli"). Results are cached,
+    since the pledge configuration doesn't change while the bot runs.
 
     Args:
         name: Raw pledge name from message
@@ -57,12 +63,14 @@ def normalize_pledge_name(name: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=256)
 def validate_pledge_name(name: str) -> Optional[str]:
     """
     Validate and normalize a pledge name.
 
-    Checks if the name (after normalization) is in the list of valid pledges.
-    Returns the normalized name if valid, None otherwise.
+    Checks if the name (after normalization) is in the set of valid pledges.
+    Returns the normalized name if valid, None otherwise. Results are cached
+    like normalize_pledge_name's.
 
     Args:
         name: Pledge name to validate
@@ -107,7 +115,7 @@ def parse_point_message(content: str) -> Optional[Tuple[int, str, str]]:
         return None
 
     # Extract point change using regex
-    point_match = re.match(POINT_REGEX_PATTERN, content)
+    point_match = _POINT_REGEX.match(content)
     if not point_match:
         return None
 
@@ -1,29 +1,30 @@
 import os
+import tempfile
 import time
 
 import discord
 from discord.ext import commands
 
-from PledgePoints.constants import VALID_PLEDGES
-from PledgePoints.messages import (
-    fetch_messages_from_days_ago,
-    process_messages,
-    eliminate_duplicates,
+from PledgePoints.messages import fetch_messages_from_days_ago, process_messages
+from PledgePoints.pledges import (
+    filter_valid_pledges,
+    get_pledge_points,
+    rank_pledges,
+    plot_rankings,
 )
-from PledgePoints.pledges import get_pledge_points, rank_pledges, plot_rankings
 from PledgePoints.sqlutils import DatabaseManager
 from config.settings import get_config
 from utils.discord_helpers import (
     send_chunked_message,
     format_point_entry_detailed,
     format_rankings_text,
-    format_pending_points_list,
+    format_pending_points_embeds,
     format_approval_confirmation,
     format_pending_reset_confirmation,
 )
 
 
-def setup(bot: commands.Bot):
+def setup(bot: commands.Bot) -> DatabaseManager:
     """
     Set up all pledge points-related slash commands for the bot.
 
@@ -33,6 +34,9 @@ def setup(bot: commands.Bot):
 
     Args:
         bot: Discord bot instance to register commands with
+
+    Returns:
+        DatabaseManager: The manager the commands use; close it on shutdown
     """
     # Load configuration from centralized config
     config = get_config()
@@ -49,7 +53,7 @@ def setup(bot: commands.Bot):
 
         This command scans the configured channel for messages from the specified
         number of days ago, validates them, and adds new point entries to the database.
-        Duplicates are automatically filtered out.
+        Duplicates are skipped in the same transaction as the insert.
 
         Args:
             interaction: Discord interaction from the slash command
@@ -67,39 +71,34 @@ def setup(bot: commands.Bot):
             await interaction.response.send_message(
                 f"Updating pledge points for {days_ago} days ago"
             )
+            # Stream messages from Discord using config and process them into
+            # PointEntry objects as they arrive
             start_time_1 = time.time()
-            # Fetch messages from Discord using config
-            messages = await fetch_messages_from_days_ago(
+            messages = fetch_messages_from_days_ago(
                 bot, config.points_channel_id, days_ago
             )
+            new_entries = await process_messages(messages)
+            end_time_1 = time.time()
 
-            if not messages:
+            if not new_entries:
                 await interaction.followup.send(
-                    "No messages found for the specified time period."
+                    "No valid point submissions found for the specified time period."
                 )
                 return
-            end_time_1 = time.time()
-            # Process messages into PointEntry objects
+
             start_time_2 = time.time()
-            new_entries = await process_messages(messages)
+            # Add new entries to the database, skipping duplicates atomically
+            inserted_entries = db_manager.insert_if_new(new_entries)
             end_time_2 = time.time()
 
-            start_time_3 = time.time()
-            # Eliminate duplicates using the database manager
-            unique_entries = eliminate_duplicates(new_entries, db_manager)
-
-            if not unique_entries:
+            if not inserted_entries:
                 await interaction.followup.send("No new points to add to the database.")
                 return
-            end_time_3 = time.time()
-            # Add new entries to the database
 
-            count = db_manager.add_point_entries(unique_entries)
             await interaction.followup.send(
-                f"Successfully added {count} new points to the database. \n"
-                f"Fetching Messages took {(end_time_1 - start_time_1):.2f} seconds.\n"
-                f"Processing Messages took {(end_time_2 - start_time_2):.2f} seconds.\n"
-                f"Eliminating Duplicates took {(end_time_3 - start_time_3):.2f} seconds.\n"
+                f"Successfully added {len(inserted_entries)} new points to the database. \n"
+                f"Fetching and Processing Messages took {(end_time_1 - start_time_1):.2f} seconds.\n"
+                f"Saving New Points took {(end_time_2 - start_time_2):.2f} seconds.\n"
             )
         except Exception as e:
             await interaction.followup.send(f"An error occurred: {str(e)}")
@@ -140,7 +139,7 @@ def setup(bot: commands.Bot):
             rankings_df = rank_pledges(points)
 
             # Filter to only include current pledges from VALID_PLEDGES
-            rankings_df = rankings_df[rankings_df.index.isin(VALID_PLEDGES)]
+            rankings_df = filter_valid_pledges(rankings_df)
 
             rankings = [
                 (pledge, int(total_points))
@@ -199,19 +198,19 @@ def setup(bot: commands.Bot):
             rankings_df = rank_pledges(points)
 
             # Filter to only include current pledges from VALID_PLEDGES
-            rankings_df = rankings_df[rankings_df.index.isin(VALID_PLEDGES)]
+            rankings_df = filter_valid_pledges(rankings_df)
 
             if rankings_df.empty:
                 await interaction.followup.send("No pledge data found in the database.")
                 return
 
-            # Generate plot and send as file
-            plot_file = plot_rankings(rankings_df)
-            await interaction.followup.send(file=discord.File(plot_file))
-
-            # Clean up the generated plot file
-            if os.path.exists(plot_file):
-                os.remove(plot_file)
+            # Generate the plot in a private temporary directory so concurrent
+            # commands never share a file; it's removed once the file is sent
+            with tempfile.TemporaryDirectory() as plot_dir:
+                plot_file = plot_rankings(
+                    rankings_df, os.path.join(plot_dir, "rankings.png")
+                )
+                await interaction.followup.send(file=discord.File(plot_file))
 
         except Exception as e:
             await interaction.followup.send(
@@ -251,11 +250,9 @@ def setup(bot: commands.Bot):
                 await interaction.followup.send("No pending points found.")
                 return
 
-            # Format the pending points using utility function
-            pending_text = format_pending_points_list(pending_entries)
-
-            # Send with automatic chunking if needed
-            await send_chunked_message(interaction, pending_text)
+            # One embed field per entry, split across embeds as needed
+            for embed in format_pending_points_embeds(pending_entries):
+                await interaction.followup.send(embed=embed)
 
         except Exception as e:
             await interaction.followup.send(
@@ -564,3 +561,5 @@ def setup(bot: commands.Bot):
                 f"An error occurred while fetching point details: {str(e)}"
             )
             raise
+
+    return db_manager
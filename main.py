@@ -37,6 +37,8 @@ bot.http.get_session = get_session  # type: ignore
 
 # Add start_time attribute to bot
 setattr(bot, "start_time", None)
+# Database manager used by the points commands, closed when the bot shuts down
+setattr(bot, "db_manager", None)
 
 
 @bot.event
@@ -51,7 +53,7 @@ async def on_ready():
     try:
         # Set up command modules
         setup_admin(bot)
-        setup_points(bot)
+        bot.db_manager = setup_points(bot)
 
         # Synchronize slash commands with Discord's API
         synced = await bot.tree.sync()
@@ -172,6 +174,9 @@ async def main():
         print("Successfully connected to Discord")
     except Exception as e:
         print(f"Error during startup: {str(e)}")
+    finally:
+        if bot.db_manager is not None:
+            bot.db_manager.close()
 
 
 if __name__ == "__main__":
@@ -5,13 +5,17 @@ import pytest
 
 from PledgePoints.models import PointEntry
 
+# Fixed timestamps for tests that don't depend on the current time
+_T0 = datetime(2024, 1, 1, 12, 0, 0)
+_T1 = datetime(2024, 1, 1, 13, 0, 0)
+
 
 class TestPointEntry:
     """Tests for PointEntry dataclass."""
 
     def test_point_entry_creation(self):
         """Test creating a basic PointEntry."""
-        time = datetime.now()
+        time = _T0
         entry = PointEntry(
             time=time,
             point_change=10,
@@ -32,8 +36,8 @@ class TestPointEntry:
 
     def test_point_entry_with_approval(self):
         """Test creating a PointEntry with approval information."""
-        time = datetime.now()
-        approval_time = datetime.now()
+        time = _T0
+        approval_time = _T1
         entry = PointEntry(
             time=time,
             point_change=10,
@@ -51,9 +55,23 @@ class TestPointEntry:
         assert entry.approved_by == "Admin"
         assert entry.approval_timestamp == approval_time
 
+    def test_point_entry_uses_slots(self):
+        """Test that PointEntry instances don't carry a per-instance __dict__."""
+        entry = PointEntry(
+            time=_T0,
+            point_change=10,
+            pledge="John",
+            brother="Mike",
+            comment="Great work",
+        )
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown_field = "value"
+
     def test_to_tuple(self):
         """Test converting PointEntry to tuple format."""
-        time = datetime.now()
+        time = _T0
         entry = PointEntry(
             time=time,
             point_change=10,
@@ -98,8 +116,8 @@ class TestPointEntry:
 
     def test_from_db_row_with_datetime_objects(self):
         """Test from_db_row when time is already a datetime object."""
-        time_obj = datetime.now()
-        approval_time_obj = datetime.now()
+        time_obj = _T0
+        approval_time_obj = _T1
 
         row = (
             1,
@@ -181,6 +199,66 @@ class TestPointEntry:
 
         assert entry.approval_status == "pending"
 
+    def test_from_db_rows_skips_invalid_rows(self):
+        """Test bulk conversion from rows, skipping rows that can't be parsed."""
+        rows = iter(
+            [
+                (
+                    1,
+                    "2024-01-15T10:30:00",
+                    10,
+                    "John",
+                    "Mike",
+                    "Great",
+                    "pending",
+                    None,
+                    None,
+                ),
+                (2, "not-a-time", 5, "Jane", "Tom", "Broken", "pending", None, None),
+                (
+                    3,
+                    "2024-01-16T10:30:00",
+                    -5,
+                    "Jane",
+                    "Tom",
+                    "Late",
+                    "approved",
+                    "Admin",
+                    None,
+                ),
+            ]
+        )
+
+        entries = PointEntry.from_db_rows(rows)
+
+        assert [entry.entry_id for entry in entries] == [1, 3]
+        assert entries[1].approval_status == "approved"
+
+    def test_from_db_rows_shares_repeated_names(self):
+        """Test that entries with the same names share one string object."""
+        # Build the names at runtime so each row gets its own str, as from SQLite
+        rows = [
+            (
+                i,
+                "2024-01-15T10:30:00",
+                1,
+                "".join("Jane"),
+                "".join("Tom"),
+                "",
+                "",
+                None,
+                None,
+            )
+            for i in range(3)
+        ]
+        assert rows[0][3] is not rows[1][3]
+
+        entries = PointEntry.from_db_rows(rows)
+
+        assert entries[0].pledge is entries[1].pledge is entries[2].pledge
+        assert entries[0].brother is entries[2].brother
+        assert entries[0].pledge == "Jane"
+
     def test_from_simple_row(self):
         """Test creating PointEntry from a simple database row."""
         time_str = "2024-01-15T10:30:00"
@@ -207,7 +285,7 @@ class TestPointEntry:
 
     def test_from_simple_row_with_datetime_object(self):
         """Test from_simple_row when time is already a datetime object."""
-        time_obj = datetime.now()
+        time_obj = _T0
 
         row = (
             time_obj,  # Already a datetime
@@ -223,7 +301,7 @@ class TestPointEntry:
 
     def test_negative_points(self):
         """Test PointEntry with negative points."""
-        time = datetime.now()
+        time = _T0
         entry = PointEntry(
             time=time,
             point_change=-5,
@@ -236,8 +314,8 @@ class TestPointEntry:
 
     def test_rejected_status(self):
         """Test PointEntry with rejected status."""
-        time = datetime.now()
-        approval_time = datetime.now()
+        time = _T0
+        approval_time = _T1
         entry = PointEntry(
             time=time,
             point_change=10,
@@ -250,4 +328,40 @@ class TestPointEntry:
             approval_timestamp=approval_time,
         )
 
-        assert entry.approval_status == "rejected"
\ No newline at end of file
+        assert entry.approval_status == "rejected"
+
+
+class TestTimestampParsing:
+    """Tests for the timestamp parser used when loading rows."""
+
+    def test_invalid_time_raises_value_error(self):
+        """Test that an invalid entry time raises ValueError for callers to skip."""
+        row = ("not-a-time", 10, "John", "Mike", "Great work")
+
+        with pytest.raises(ValueError):
+            PointEntry.from_simple_row(row)
+
+    def test_non_string_approval_timestamp_is_ignored(self):
+        """Test that an approval timestamp of an unexpected type becomes None."""
+        row = (
+            1,
+            "2024-01-15T10:30:00",
+            10,
+            "John",
+            "Mike",
+            "Great work",
+            "approved",
+            "Admin",
+            1705314600,
+        )
+
+        entry = PointEntry.from_db_row(row)
+
+        assert entry.approval_timestamp is None
+
+    def test_missing_time_raises_type_error(self):
+        """Test that a row without a time raises TypeError for callers to skip."""
+        row = (1, None, 10, "John", "Mike", "Great work", "pending", None, None)
+
+        with pytest.raises(TypeError):
+            PointEntry.from_db_row(row)
@@ -1,33 +1,51 @@
 """Unit tests for pledge ranking and plotting utilities."""
 
 import os
-import tempfile
-from datetime import datetime
-from unittest.mock import Mock
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
 
 from PledgePoints.models import PointEntry
-from PledgePoints.pledges import get_pledge_points, rank_pledges, plot_rankings
+from PledgePoints.pledges import (
+    filter_valid_pledges,
+    get_pledge_points,
+    rank_pledges,
+    plot_rankings,
+)
 from PledgePoints.sqlutils import DatabaseManager
 
+# Fixed timestamp for tests that don't depend on the current time
+_T0 = datetime(2024, 1, 1, 12, 0, 0)
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
 
+def make_points_df(points):
+    """Build a points DataFrame from (pledge, point_change) pairs."""
+    return pd.DataFrame.from_records(
+        [(pledge, change, _T0, "Mike", "Test") for pledge, change in points],
+        columns=["Pledge", "PointChange", "Time", "Brother", "Comment"],
+    )
 
-@pytest.fixture
-def db_manager_with_data(temp_db):
-    """Create a DatabaseManager with sample approved data."""
-    manager = DatabaseManager(temp_db)
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test in its own directory so parallel workers don't share rankings.png."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def db_manager_with_data():
+    """
+    Create a DatabaseManager with sample approved data.
+
+    Seeded once and shared by every test in this module, so tests using it
+    must only read from it.
+    """
+    manager = DatabaseManager(":memory:")
 
     # Add some sample entries
     entries = [
@@ -75,15 +93,16 @@ def db_manager_with_data(temp_db):
     point_ids = [p.entry_id for p in pending]
     manager.approve_points(point_ids, "Admin")
 
-    return manager
+    yield manager
+    manager.close()
 
 
 class TestGetPledgePoints:
     """Tests for get_pledge_points function."""
 
-    def test_get_pledge_points_empty_database(self, temp_db):
+    def test_get_pledge_points_empty_database(self, make_db_manager):
         """Test getting points from empty database returns empty DataFrame."""
-        manager = DatabaseManager(temp_db)
+        manager = make_db_manager()
         df = get_pledge_points(manager)
 
         assert isinstance(df, pd.DataFrame)
@@ -101,6 +120,15 @@ class TestGetPledgePoints:
         expected_columns = {"Time", "PointChange", "Pledge", "Brother", "Comment"}
         assert set(df.columns) == expected_columns
 
+    def test_get_pledge_points_uses_read_connection(self, db_manager_with_data):
+        """Test that reading points reuses the manager's shared read connection."""
+        db_manager_with_data.get_read_connection()
+
+        with patch("PledgePoints.sqlutils.sqlite3.connect") as connect:
+            get_pledge_points(db_manager_with_data)
+
+        connect.assert_not_called()
+
     def test_get_pledge_points_sorted_by_time(self, db_manager_with_data):
         """Test that points are sorted by time in descending order."""
         df = get_pledge_points(db_manager_with_data)
@@ -109,14 +137,14 @@ class TestGetPledgePoints:
         times = df["Time"].tolist()
         assert times == sorted(times, reverse=True)
 
-    def test_get_pledge_points_only_approved(self, temp_db):
+    def test_get_pledge_points_only_approved(self, make_db_manager):
         """Test that only approved points are returned."""
-        manager = DatabaseManager(temp_db)
+        manager = make_db_manager()
 
         # Add entries but don't approve them
         entries = [
             PointEntry(
-                time=datetime.now(),
+                time=_T0,
                 point_change=10,
                 pledge="John",
                 brother="Mike",
@@ -136,6 +164,57 @@ class TestGetPledgePoints:
 
         assert pd.api.types.is_datetime64_any_dtype(df["Time"])
 
+    def test_get_pledge_points_downcasts_point_change(self, make_db_manager):
+        """Test that PointChange is narrowed without changing the ranking totals."""
+        manager = make_db_manager()
+        manager.add_point_entries(
+            [
+                PointEntry(
+                    time=_T0,
+                    point_change=100,
+                    pledge="John",
+                    brother="Mike",
+                    comment=f"Entry {i}",
+                )
+                for i in range(5)
+            ]
+        )
+        manager.approve_all_pending("Admin")
+
+        df = get_pledge_points(manager)
+        rankings = rank_pledges(df)
+
+        assert df["PointChange"].dtype == "int8"
+        assert rankings["John"] == 500
+        assert rankings.dtype == "int64"
+
+    def test_get_pledge_points_skips_unparseable_times(self, make_db_manager):
+        """Test that UTC timestamps load and rows with invalid times are dropped."""
+        manager = make_db_manager()
+        manager.add_point_entries(
+            [
+                PointEntry(
+                    time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+                    point_change=10,
+                    pledge="John",
+                    brother="Mike",
+                    comment="Great work",
+                ),
+            ]
+        )
+        with manager.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment) "
+                "VALUES ('not-a-time', 5, 'Jane', 'Tom', 'Broken row')"
+            )
+        manager.approve_all_pending("Admin")
+
+        df = get_pledge_points(manager)
+
+        assert len(df) == 1
+        assert df["Pledge"].tolist() == ["John"]
+        assert df["Time"].iloc[0] == pd.Timestamp("2024-01-01 10:00:00", tz="UTC")
+
 
 class TestRankPledges:
     """Tests for rank_pledges function."""
@@ -150,14 +229,14 @@ class TestRankPledges:
 
     def test_rank_pledges_basic(self):
         """Test basic ranking functionality."""
-        df = pd.DataFrame(
-            {
-                "Pledge": ["John", "Jane", "John", "Jane", "Bob"],
-                "PointChange": [10, 5, 15, -5, 20],
-                "Time": [datetime.now()] * 5,
-                "Brother": ["Mike"] * 5,
-                "Comment": ["Test"] * 5,
-            }
+        df = make_points_df(
+            [
+                ("John", 10),
+                ("Jane", 5),
+                ("John", 15),
+                ("Jane", -5),
+                ("Bob", 20),
+            ]
         )
 
         rankings = rank_pledges(df)
@@ -172,15 +251,7 @@ class TestRankPledges:
 
     def test_rank_pledges_sorted_descending(self):
         """Test that rankings are sorted in descending order."""
-        df = pd.DataFrame(
-            {
-                "Pledge": ["John", "Jane", "Bob"],
-                "PointChange": [10, 30, 20],
-                "Time": [datetime.now()] * 3,
-                "Brother": ["Mike"] * 3,
-                "Comment": ["Test"] * 3,
-            }
-        )
+        df = make_points_df([("John", 10), ("Jane", 30), ("Bob", 20)])
 
         rankings = rank_pledges(df)
 
@@ -194,21 +265,29 @@ class TestRankPledges:
 
     def test_rank_pledges_with_negatives(self):
         """Test ranking with negative points."""
+        df = make_points_df([("John", -10), ("Jane", -5)])
+
+        rankings = rank_pledges(df)
+
+        assert rankings["John"] == -10
+        assert rankings["Jane"] == -5
+        assert rankings.index[0] == "Jane"  # Less negative is higher
+
+    def test_rank_pledges_matches_groupby(self):
+        """Test that totals and dtype match a plain groupby sum, with ties alphabetical."""
         df = pd.DataFrame(
             {
-                "Pledge": ["John", "Jane"],
-                "PointChange": [-10, -5],
-                "Time": [datetime.now()] * 2,
-                "Brother": ["Mike"] * 2,
-                "Comment": ["Test"] * 2,
+                "Pledge": ["Zed", "Amy", "Bob", "Amy", "Zed", "Cal"],
+                "PointChange": [3, 1, 5, 4, 2, -1],
             }
         )
 
         rankings = rank_pledges(df)
+        expected = df.groupby("Pledge")["PointChange"].sum()
 
-        assert rankings["John"] == -10
-        assert rankings["Jane"] == -5
-        assert rankings.index[0] == "Jane"  # Less negative is higher
+        assert rankings.to_dict() == expected.to_dict()
+        assert rankings.dtype == expected.dtype
+        assert rankings.index.tolist() == ["Amy", "Bob", "Zed", "Cal"]
 
     def test_rank_pledges_with_real_data(self, db_manager_with_data):
         """Test ranking with real database data."""
@@ -227,6 +306,28 @@ class TestRankPledges:
         assert rankings.index[0] == "John"
 
 
+class TestFilterValidPledges:
+    """Tests for filter_valid_pledges function."""
+
+    def test_filter_keeps_current_pledges_in_order(self, monkeypatch):
+        """Test that only current pledges remain, in ranking order."""
+        monkeypatch.setattr(
+            "PledgePoints.pledges.VALID_PLEDGES", frozenset({"John", "Jane", "Bob"})
+        )
+        rankings = pd.Series({"John": 30, "Former": 25, "Jane": 20, "Bob": 5})
+
+        filtered = filter_valid_pledges(rankings)
+
+        assert filtered.index.tolist() == ["John", "Jane", "Bob"]
+        assert filtered.tolist() == [30, 20, 5]
+
+    def test_filter_with_no_current_pledges(self):
+        """Test that filtering out every pledge gives an empty Series."""
+        rankings = pd.Series({"Former": 25})
+
+        assert filter_valid_pledges(rankings).empty
+
+
 class TestPlotRankings:
     """Tests for plot_rankings function."""
 
@@ -239,49 +340,45 @@ class TestPlotRankings:
         assert filename == "rankings.png"
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
+    def test_plot_rankings_custom_path(self, tmp_path):
+        """Test that plot_rankings saves to and returns the given path."""
+        rankings = pd.Series({"John": 25, "Jane": 15})
+        path = str(tmp_path / "plots" / "custom.png")
+        os.makedirs(os.path.dirname(path))
 
-    def test_plot_rankings_with_single_pledge(self):
+        filename = plot_rankings(rankings, path)
+
+        assert filename == path
+        assert os.path.exists(path)
+        assert not os.path.exists("rankings.png")
+
+    def test_plot_rankings_with_single_pledge(self, tmp_path):
         """Test plotting with a single pledge."""
         rankings = pd.Series({"John": 25})
 
-        filename = plot_rankings(rankings)
+        filename = plot_rankings(rankings, str(tmp_path / "rankings.png"))
 
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
-
-    def test_plot_rankings_preserves_order(self):
+    def test_plot_rankings_preserves_order(self, tmp_path):
         """Test that plot preserves descending order of rankings."""
         # Create rankings in descending order
         rankings = pd.Series({"Alice": 30, "Bob": 20, "Charlie": 10})
 
-        filename = plot_rankings(rankings)
+        filename = plot_rankings(rankings, str(tmp_path / "rankings.png"))
 
         # File should exist
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
-
-    def test_plot_rankings_with_negative_values(self):
+    def test_plot_rankings_with_negative_values(self, tmp_path):
         """Test plotting with negative point values."""
         rankings = pd.Series({"John": -5, "Jane": -10})
 
-        filename = plot_rankings(rankings)
+        filename = plot_rankings(rankings, str(tmp_path / "rankings.png"))
 
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
-
-    def test_plot_rankings_with_many_pledges(self):
+    def test_plot_rankings_with_many_pledges(self, tmp_path):
         """Test plotting with many pledges to check figure sizing."""
         rankings = pd.Series(
             {
@@ -289,13 +386,35 @@ class TestPlotRankings:
             }
         )
 
-        filename = plot_rankings(rankings)
+        filename = plot_rankings(rankings, str(tmp_path / "rankings.png"))
 
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
+    def test_plot_rankings_reuses_figure(self):
+        """Test that repeated plots redraw a single figure resized to the data."""
+        from PledgePoints import pledges
+
+        plot_rankings(pd.Series({"John": 25, "Jane": 15}))
+        figure = pledges._rankings_figure
+
+        plot_rankings(pd.Series({f"Pledge{i}": 100 - i for i in range(12)}))
+
+        assert pledges._rankings_figure is figure
+        assert len(figure.axes) == 1
+        assert len(figure.axes[0].patches) == 12
+        assert figure.get_size_inches()[0] == pytest.approx(12 * 0.7)
+
+    def test_import_does_not_load_matplotlib(self):
+        """Test that importing the module defers matplotlib until a plot is drawn."""
+        code = (
+            "import sys; import PledgePoints.pledges; "
+            "sys.exit('matplotlib' in sys.modules or 'seaborn' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2]
+        )
+
+        assert result.returncode == 0
 
 
 class TestIntegrationWorkflow:
@@ -315,14 +434,8 @@ class TestIntegrationWorkflow:
         filename = plot_rankings(rankings)
         assert os.path.exists(filename)
 
-        # Cleanup
-        if os.path.exists(filename):
-            os.remove(filename)
-
     def test_workflow_with_filtering(self, db_manager_with_data):
         """Test workflow with filtering for specific pledges."""
-        from PledgePoints.constants import VALID_PLEDGES
-
         # Get points
         df = get_pledge_points(db_manager_with_data)
 
@@ -330,7 +443,7 @@ class TestIntegrationWorkflow:
         rankings = rank_pledges(df)
 
         # Filter to only valid pledges (as done in commands/points.py)
-        filtered_rankings = rankings[rankings.index.isin(VALID_PLEDGES)]
+        filtered_rankings = filter_valid_pledges(rankings)
 
         # This should work even if some pledges are filtered out
         assert isinstance(filtered_rankings, pd.Series)
@@ -1,38 +1,69 @@
 """Unit tests for PledgePoints database utilities."""
 
 import os
-import tempfile
-from datetime import datetime
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
 from PledgePoints.models import PointEntry
 from PledgePoints.sqlutils import DatabaseManager
 
+# Fixed timestamp for entries whose time doesn't matter to the test
+_T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+# Entries shared by tests that just need rows in the table. DatabaseManager
+# never modifies the entries it's given, so tests can reuse these instances.
+SAMPLE_ENTRIES = (
+    PointEntry(
+        time=_T0, point_change=10, pledge="John", brother="Mike", comment="Great work"
+    ),
+    PointEntry(
+        time=_T0, point_change=5, pledge="Jane", brother="Tom", comment="Good job"
+    ),
+    PointEntry(
+        time=_T0, point_change=-5, pledge="Jane", brother="Tom", comment="Late to event"
+    ),
+    PointEntry(
+        time=_T0, point_change=15, pledge="John", brother="Sarah", comment="Outstanding"
+    ),
+)
+
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
+def temp_db(tmp_path):
+    """Create a temporary database path for tests that need a real file."""
+    return str(tmp_path / "test.db")
 
 
 @pytest.fixture
-def db_manager(temp_db):
-    """Create a DatabaseManager instance with a temporary database."""
-    return DatabaseManager(temp_db)
+def db_manager():
+    """Create a DatabaseManager instance with a private in-memory database."""
+    manager = DatabaseManager(":memory:")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope="module")
+def empty_db_manager():
+    """
+    Create one empty in-memory DatabaseManager shared by the whole module.
+
+    Only for tests that leave the database empty, e.g. lookups of missing IDs
+    or updates that match no rows.
+    """
+    manager = DatabaseManager(":memory:")
+    yield manager
+    manager.close()
 
 
 class TestDatabaseManagerInit:
     """Tests for DatabaseManager initialization."""
 
-    def test_database_creation(self, temp_db):
+    def test_database_creation(self, temp_db, make_db_manager):
         """Test that database and table are created."""
-        manager = DatabaseManager(temp_db)
+        manager = make_db_manager(temp_db)
         assert os.path.exists(temp_db)
 
         # Verify table exists
@@ -65,95 +96,288 @@ class TestDatabaseManagerInit:
             }
             assert required_columns.issubset(columns)
 
+    def test_connection_pragmas(self, temp_db, make_db_manager):
+        """Test that file databases use WAL with relaxed syncing."""
+        manager = make_db_manager(temp_db)
+
+        with manager.get_connection() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    def test_adds_missing_approval_columns(self, temp_db, make_db_manager):
+        """Test that a table from before the approval workflow is upgraded."""
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute(
+                "CREATE TABLE Points (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "Time TEXT, PointChange INTEGER, Pledge TEXT, Brother TEXT, "
+                "Comment TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment) "
+                "VALUES ('2024-01-01T12:00:00', 10, 'John', 'Mike', 'Great work')"
+            )
+        conn.close()
+
+        manager = make_db_manager(temp_db)
+        entries = manager.get_pending_points()
+
+        assert len(entries) == 1
+        assert entries[0].approval_status == "pending"
+        assert entries[0].approved_by is None
+
+    def test_message_index_exists(self, db_manager):
+        """Test that the duplicate-lookup index is created."""
+        with db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA index_list(Points)")
+            indexes = {row[1] for row in cursor.fetchall()}
+
+            assert "idx_points_message" in indexes
+
+    def test_pending_lookup_uses_status_index(self, db_manager):
+        """Test that filtering by approval status searches the status index."""
+        with db_manager.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM Points WHERE approval_status = ?",
+                ("pending",),
+            ).fetchall()
+
+        assert any("idx_points_status" in row[-1] for row in plan)
+
+    def test_in_memory_database_persists_between_operations(self, make_db_manager):
+        """Test that a ":memory:" manager keeps its data across connections."""
+        manager = make_db_manager(":memory:")
+        other_manager = make_db_manager(":memory:")
+        entry = SAMPLE_ENTRIES[0]
+
+        manager.add_point_entries([entry])
+
+        assert len(manager.get_all_points()) == 1
+        # Each in-memory manager has its own database
+        assert other_manager.get_all_points() == []
+
 
 class TestAddPointEntries:
     """Tests for adding point entries."""
 
     def test_add_single_entry(self, db_manager):
         """Test adding a single point entry."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
 
         count = db_manager.add_point_entries([entry])
         assert count == 1
 
     def test_add_multiple_entries(self, db_manager):
         """Test adding multiple point entries."""
+        entries = [SAMPLE_ENTRIES[0], SAMPLE_ENTRIES[2], SAMPLE_ENTRIES[3]]
+
+        count = db_manager.add_point_entries(entries)
+        assert count == 3
+
+    def test_add_entries_larger_than_one_statement(self, db_manager):
+        """Test that batches spanning several INSERT statements keep every row in order."""
         entries = [
             PointEntry(
-                time=datetime.now(),
+                time=_T0,
+                point_change=i % 10,
+                pledge="John",
+                brother="Mike",
+                comment=f"Entry {i}",
+            )
+            for i in range(450)
+        ]
+
+        count = db_manager.add_point_entries(entries)
+        stored = db_manager.get_all_points()
+
+        assert count == 450
+        assert [entry.comment for entry in stored] == [f"Entry {i}" for i in range(450)]
+        assert all(entry.approval_status == "pending" for entry in stored)
+
+    def test_add_empty_list(self, empty_db_manager):
+        """Test that adding nothing returns 0 without opening a connection."""
+        with patch("PledgePoints.sqlutils.sqlite3.connect") as connect:
+            count = empty_db_manager.add_point_entries([])
+
+        assert count == 0
+        connect.assert_not_called()
+
+    def test_add_entries_is_atomic(self, db_manager):
+        """Test that a failing entry rolls back the whole batch."""
+        good = SAMPLE_ENTRIES[0]
+        # sqlite3 can't bind an arbitrary object, so inserting this entry fails
+        bad = PointEntry(
+            time=_T0,
+            point_change=5,
+            pledge="Jane",
+            brother="Tom",
+            comment=object(),
+        )
+
+        with pytest.raises(sqlite3.Error):
+            db_manager.add_point_entries([good, bad])
+
+        assert db_manager.get_all_points() == []
+
+    def test_added_entries_have_pending_status(self, db_manager):
+        """Test that new entries default to pending status."""
+        entry = SAMPLE_ENTRIES[0]
+
+        db_manager.add_point_entries([entry])
+        pending = db_manager.get_pending_points()
+
+        assert len(pending) == 1
+        assert pending[0].approval_status == "pending"
+
+
+class TestInsertIfNew:
+    """Tests for inserting only entries that aren't already stored."""
+
+    def test_insert_into_empty_database(self, db_manager):
+        """Test that all entries are inserted and returned with IDs."""
+        entries = [
+            PointEntry(
+                time=datetime(2024, 1, 1, 10, 0, 0),
                 point_change=10,
                 pledge="John",
                 brother="Mike",
                 comment="Great work",
             ),
             PointEntry(
-                time=datetime.now(),
+                time=datetime(2024, 1, 2, 10, 0, 0),
                 point_change=-5,
                 pledge="Jane",
                 brother="Tom",
                 comment="Late to event",
             ),
-            PointEntry(
-                time=datetime.now(),
-                point_change=15,
-                pledge="John",
-                brother="Sarah",
-                comment="Outstanding",
-            ),
         ]
 
-        count = db_manager.add_point_entries(entries)
-        assert count == 3
+        inserted = db_manager.insert_if_new(entries)
 
-    def test_added_entries_have_pending_status(self, db_manager):
-        """Test that new entries default to pending status."""
-        entry = PointEntry(
-            time=datetime.now(),
+        assert len(inserted) == 2
+        assert all(entry.entry_id is not None for entry in inserted)
+        assert len(db_manager.get_pending_points()) == 2
+
+    def test_skips_existing_and_repeated_entries(self, db_manager):
+        """Test that duplicates, in any status or with another brother, are skipped."""
+        time1 = datetime(2024, 1, 1, 10, 0, 0, 123456)
+        existing = PointEntry(
+            time=time1,
             point_change=10,
             pledge="John",
             brother="Mike",
             comment="Great work",
         )
+        db_manager.add_point_entries([existing])
+        db_manager.reject_all_pending("Admin")
 
-        db_manager.add_point_entries([entry])
-        pending = db_manager.get_pending_points()
+        new_entries = [
+            PointEntry(
+                time=time1,
+                point_change=10,
+                pledge="John",
+                brother="DifferentBrother",
+                comment="Great work",
+            ),
+            PointEntry(
+                time=datetime(2024, 1, 1, 10, 0, 0, 123457),
+                point_change=10,
+                pledge="John",
+                brother="Mike",
+                comment="Great work",
+            ),
+        ]
 
-        assert len(pending) == 1
-        assert pending[0].approval_status == "pending"
+        inserted = db_manager.insert_if_new(new_entries)
 
+        assert len(inserted) == 1
+        assert inserted[0].time == datetime(2024, 1, 1, 10, 0, 0, 123457)
 
-class TestGetPoints:
-    """Tests for retrieving point entries."""
+        # Inserting the same batch again adds nothing
+        assert db_manager.insert_if_new(new_entries) == []
+        assert len(db_manager.get_all_points()) == 2
 
-    def test_get_all_points_empty(self, db_manager):
-        """Test getting points from empty database."""
-        points = db_manager.get_all_points()
-        assert points == []
+    def test_repeated_in_one_batch_inserted_once(self, db_manager):
+        """Test that a message repeated in one batch is inserted once, in order."""
+        new_entries = [
+            PointEntry(
+                time=datetime(2024, 1, 2, 10, 0, 0),
+                point_change=5,
+                pledge="Jane",
+                brother="Mike",
+                comment="Good job",
+            ),
+            PointEntry(
+                time=datetime(2024, 1, 1, 10, 0, 0),
+                point_change=10,
+                pledge="John",
+                brother="Mike",
+                comment="Great work",
+            ),
+            PointEntry(
+                time=datetime(2024, 1, 2, 10, 0, 0),
+                point_change=5,
+                pledge="Jane",
+                brother="Tom",
+                comment="Good job",
+            ),
+        ]
 
-    def test_get_all_points(self, db_manager):
-        """Test getting all points regardless of status."""
+        inserted = db_manager.insert_if_new(new_entries)
+
+        assert [entry.brother for entry in inserted] == ["Mike", "Mike"]
+        assert [entry.pledge for entry in inserted] == ["Jane", "John"]
+
+    def test_both_write_paths_store_the_same_time_text(self, db_manager):
+        """Test that duplicates are caught whichever write path stored the row."""
+        aware = datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+        naive = datetime(2024, 1, 2, 10, 0, 0)
         entries = [
             PointEntry(
-                time=datetime.now(),
+                time=aware,
                 point_change=10,
                 pledge="John",
                 brother="Mike",
                 comment="Great work",
             ),
             PointEntry(
-                time=datetime.now(),
+                time=naive,
                 point_change=5,
                 pledge="Jane",
                 brother="Tom",
                 comment="Good job",
             ),
         ]
+        db_manager.add_point_entries(entries[:1])
+        db_manager.insert_if_new(entries[1:])
+
+        with db_manager.get_connection() as conn:
+            stored = [row[0] for row in conn.execute("SELECT Time FROM Points")]
+        assert stored == [
+            "2024-01-01 10:00:00.123456+00:00",
+            "2024-01-02 10:00:00",
+        ]
+        assert db_manager.insert_if_new(entries) == []
+
+    def test_insert_empty_list(self, empty_db_manager):
+        """Test inserting an empty list."""
+        assert empty_db_manager.insert_if_new([]) == []
+
+
+class TestGetPoints:
+    """Tests for retrieving point entries."""
+
+    def test_get_all_points_empty(self, empty_db_manager):
+        """Test getting points from empty database."""
+        points = empty_db_manager.get_all_points()
+        assert points == []
+
+    def test_get_all_points(self, db_manager):
+        """Test getting all points regardless of status."""
+        entries = list(SAMPLE_ENTRIES[:2])
         db_manager.add_point_entries(entries)
 
         all_points = db_manager.get_all_points()
@@ -161,13 +385,7 @@ class TestGetPoints:
 
     def test_get_pending_points(self, db_manager):
         """Test getting only pending points."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         pending = db_manager.get_pending_points()
@@ -176,13 +394,7 @@ class TestGetPoints:
 
     def test_get_approved_points_empty(self, db_manager):
         """Test getting approved points when none exist."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         approved = db_manager.get_approved_points()
@@ -190,13 +402,7 @@ class TestGetPoints:
 
     def test_get_point_by_id(self, db_manager):
         """Test retrieving a specific point by ID."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         # Get the entry ID from pending points
@@ -208,23 +414,39 @@ class TestGetPoints:
         assert retrieved.entry_id == point_id
         assert retrieved.pledge == "John"
 
-    def test_get_point_by_id_not_found(self, db_manager):
-        """Test retrieving a non-existent point returns None."""
-        result = db_manager.get_point_by_id(999)
-        assert result is None
-
-    def test_get_points_with_status_filter(self, db_manager):
-        """Test filtering points by multiple statuses."""
+    def test_get_points_by_ids(self, db_manager):
+        """Test fetching several entries at once, skipping unknown IDs."""
         entries = [
             PointEntry(
-                time=datetime.now(),
-                point_change=10,
+                time=_T0,
+                point_change=change,
                 pledge="John",
                 brother="Mike",
-                comment="Great work",
-            ),
+                comment=f"Entry {change}",
+            )
+            for change in (10, 20, 30)
         ]
         db_manager.add_point_entries(entries)
+        ids = [p.entry_id for p in db_manager.get_pending_points()]
+
+        retrieved = db_manager.get_points_by_ids([ids[2], 999, ids[0]])
+
+        assert [p.entry_id for p in retrieved] == [ids[0], ids[2]]
+        assert [p.point_change for p in retrieved] == [10, 30]
+
+    def test_get_points_by_ids_empty(self, empty_db_manager):
+        """Test that an empty ID list returns an empty list."""
+        assert empty_db_manager.get_points_by_ids([]) == []
+
+    def test_get_point_by_id_not_found(self, empty_db_manager):
+        """Test retrieving a non-existent point returns None."""
+        result = empty_db_manager.get_point_by_id(999)
+        assert result is None
+
+    def test_get_points_with_status_filter(self, db_manager):
+        """Test filtering points by multiple statuses."""
+        entries = [SAMPLE_ENTRIES[0]]
+        db_manager.add_point_entries(entries)
 
         # Should get pending entry
         pending = db_manager.get_all_points(status_filter=["pending"])
@@ -235,18 +457,60 @@ class TestGetPoints:
         assert len(approved) == 0
 
 
+class TestPendingPointsCache:
+    """Tests for caching of pending point entries between writes."""
+
+    def test_repeated_reads_use_cache(self, db_manager):
+        """Test that a second read without writes doesn't query the database."""
+        entry = SAMPLE_ENTRIES[0]
+        db_manager.add_point_entries([entry])
+
+        with patch.object(
+            db_manager, "get_all_points", wraps=db_manager.get_all_points
+        ) as spy:
+            first = db_manager.get_pending_points()
+            second = db_manager.get_pending_points()
+
+        assert spy.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_cached_entries_are_copies(self, db_manager):
+        """Test that modifying a returned entry doesn't change the cache."""
+        db_manager.add_point_entries([SAMPLE_ENTRIES[0]])
+
+        first = db_manager.get_pending_points()
+        first[0].comment = "Edited by a caller"
+        second = db_manager.get_pending_points()
+
+        assert second[0] is not first[0]
+        assert second[0].comment == SAMPLE_ENTRIES[0].comment
+
+    def test_writes_invalidate_cache(self, db_manager):
+        """Test that adding, approving and resetting refresh the pending list."""
+        entry = SAMPLE_ENTRIES[0]
+        assert db_manager.get_pending_points() == []
+
+        db_manager.add_point_entries([entry])
+        pending = db_manager.get_pending_points()
+        assert len(pending) == 1
+
+        db_manager.approve_points([pending[0].entry_id], "Admin")
+        assert db_manager.get_pending_points() == []
+
+        db_manager.reset_points_to_pending([pending[0].entry_id])
+        assert len(db_manager.get_pending_points()) == 1
+
+        db_manager.reject_all_pending("Admin")
+        assert db_manager.get_pending_points() == []
+
+
 class TestApprovePoints:
     """Tests for approving point entries."""
 
     def test_approve_single_point(self, db_manager):
         """Test approving a single point entry."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         pending = db_manager.get_pending_points()
@@ -263,22 +527,7 @@ class TestApprovePoints:
 
     def test_approve_multiple_points(self, db_manager):
         """Test approving multiple point entries."""
-        entries = [
-            PointEntry(
-                time=datetime.now(),
-                point_change=10,
-                pledge="John",
-                brother="Mike",
-                comment="Great work",
-            ),
-            PointEntry(
-                time=datetime.now(),
-                point_change=5,
-                pledge="Jane",
-                brother="Tom",
-                comment="Good job",
-            ),
-        ]
+        entries = list(SAMPLE_ENTRIES[:2])
         db_manager.add_point_entries(entries)
 
         pending = db_manager.get_pending_points()
@@ -287,34 +536,39 @@ class TestApprovePoints:
         approved = db_manager.approve_points(point_ids, "Admin")
         assert len(approved) == 2
 
-    def test_approve_empty_list(self, db_manager):
+        # Verify both entries were approved in the database
+        retrieved = db_manager.get_points_by_ids(point_ids)
+        assert [p.approval_status for p in retrieved] == ["approved", "approved"]
+
+    def test_approve_returns_updated_entries(self, db_manager):
+        """Test that approved entries come back with their new status, in ID order."""
+        db_manager.add_point_entries(list(SAMPLE_ENTRIES[:3]))
+        point_ids = [p.entry_id for p in db_manager.get_pending_points()]
+        db_manager.reject_points([point_ids[1]], "Admin")
+
+        approved = db_manager.approve_points(list(reversed(point_ids)), "Admin")
+
+        # The rejected entry is no longer pending, so it isn't approved
+        assert [p.entry_id for p in approved] == [point_ids[0], point_ids[2]]
+        assert all(p.approval_status == "approved" for p in approved)
+        assert all(p.approved_by == "Admin" for p in approved)
+        assert all(p.approval_timestamp is not None for p in approved)
+
+    def test_approve_empty_list(self, empty_db_manager):
         """Test approving with empty ID list."""
-        approved = db_manager.approve_points([], "Admin")
+        with patch("PledgePoints.sqlutils.sqlite3.connect") as connect:
+            approved = empty_db_manager.approve_points([], "Admin")
         assert approved == []
+        connect.assert_not_called()
 
-    def test_approve_nonexistent_ids(self, db_manager):
+    def test_approve_nonexistent_ids(self, empty_db_manager):
         """Test approving non-existent IDs returns empty list."""
-        approved = db_manager.approve_points([999, 1000], "Admin")
+        approved = empty_db_manager.approve_points([999, 1000], "Admin")
         assert approved == []
 
     def test_approve_all_pending(self, db_manager):
         """Test approving all pending points."""
-        entries = [
-            PointEntry(
-                time=datetime.now(),
-                point_change=10,
-                pledge="John",
-                brother="Mike",
-                comment="Great work",
-            ),
-            PointEntry(
-                time=datetime.now(),
-                point_change=5,
-                pledge="Jane",
-                brother="Tom",
-                comment="Good job",
-            ),
-        ]
+        entries = list(SAMPLE_ENTRIES[:2])
         db_manager.add_point_entries(entries)
 
         approved = db_manager.approve_all_pending("Admin")
@@ -324,20 +578,14 @@ class TestApprovePoints:
         pending = db_manager.get_pending_points()
         assert len(pending) == 0
 
-    def test_approve_all_pending_when_none_exist(self, db_manager):
+    def test_approve_all_pending_when_none_exist(self, empty_db_manager):
         """Test approve_all_pending when no pending points exist."""
-        approved = db_manager.approve_all_pending("Admin")
+        approved = empty_db_manager.approve_all_pending("Admin")
         assert approved == []
 
     def test_approved_points_persisted(self, db_manager):
         """Test that approved points are properly persisted."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         pending = db_manager.get_pending_points()
@@ -356,13 +604,7 @@ class TestRejectPoints:
 
     def test_reject_single_point(self, db_manager):
         """Test rejecting a single point entry."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         pending = db_manager.get_pending_points()
@@ -377,22 +619,7 @@ class TestRejectPoints:
 
     def test_reject_multiple_points(self, db_manager):
         """Test rejecting multiple point entries."""
-        entries = [
-            PointEntry(
-                time=datetime.now(),
-                point_change=10,
-                pledge="John",
-                brother="Mike",
-                comment="Great work",
-            ),
-            PointEntry(
-                time=datetime.now(),
-                point_change=5,
-                pledge="Jane",
-                brother="Tom",
-                comment="Good job",
-            ),
-        ]
+        entries = list(SAMPLE_ENTRIES[:2])
         db_manager.add_point_entries(entries)
 
         pending = db_manager.get_pending_points()
@@ -401,29 +628,18 @@ class TestRejectPoints:
         rejected = db_manager.reject_points(point_ids, "Admin")
         assert len(rejected) == 2
 
-    def test_reject_empty_list(self, db_manager):
+        # Verify both entries were rejected in the database
+        retrieved = db_manager.get_points_by_ids(point_ids)
+        assert [p.approval_status for p in retrieved] == ["rejected", "rejected"]
+
+    def test_reject_empty_list(self, empty_db_manager):
         """Test rejecting with empty ID list."""
-        rejected = db_manager.reject_points([], "Admin")
+        rejected = empty_db_manager.reject_points([], "Admin")
         assert rejected == []
 
     def test_reject_all_pending(self, db_manager):
         """Test rejecting all pending points."""
-        entries = [
-            PointEntry(
-                time=datetime.now(),
-                point_change=10,
-                pledge="John",
-                brother="Mike",
-                comment="Great work",
-            ),
-            PointEntry(
-                time=datetime.now(),
-                point_change=5,
-                pledge="Jane",
-                brother="Tom",
-                comment="Good job",
-            ),
-        ]
+        entries = list(SAMPLE_ENTRIES[:2])
         db_manager.add_point_entries(entries)
 
         rejected = db_manager.reject_all_pending("Admin")
@@ -433,20 +649,14 @@ class TestRejectPoints:
         pending = db_manager.get_pending_points()
         assert len(pending) == 0
 
-    def test_reject_all_pending_when_none_exist(self, db_manager):
+    def test_reject_all_pending_when_none_exist(self, empty_db_manager):
         """Test reject_all_pending when no pending points exist."""
-        rejected = db_manager.reject_all_pending("Admin")
+        rejected = empty_db_manager.reject_all_pending("Admin")
         assert rejected == []
 
     def test_rejected_not_in_approved(self, db_manager):
         """Test that rejected points don't appear in approved list."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
 
         pending = db_manager.get_pending_points()
@@ -463,13 +673,7 @@ class TestResetPointsToPending:
 
     def test_reset_approved_entry(self, db_manager):
         """Move an approved entry back to pending and clear approver metadata."""
-        entry = PointEntry(
-            time=datetime.now(),
-            point_change=10,
-            pledge="John",
-            brother="Mike",
-            comment="Great work",
-        )
+        entry = SAMPLE_ENTRIES[0]
         db_manager.add_point_entries([entry])
         pending = db_manager.get_pending_points()
         point_id = pending[0].entry_id
@@ -487,7 +691,7 @@ class TestResetPointsToPending:
     def test_reset_rejected_entry(self, db_manager):
         """Move a rejected entry back to pending."""
         entry = PointEntry(
-            time=datetime.now(),
+            time=_T0,
             point_change=5,
             pledge="Jane",
             brother="Tom",
@@ -505,9 +709,9 @@ class TestResetPointsToPending:
         retrieved = db_manager.get_point_by_id(point_id)
         assert retrieved.approval_status == "pending"
 
-    def test_reset_empty_ids(self, db_manager):
+    def test_reset_empty_ids(self, empty_db_manager):
         """No-op when given an empty ID list."""
-        result = db_manager.reset_points_to_pending([])
+        result = empty_db_manager.reset_points_to_pending([])
         assert result == []
 
 
@@ -524,17 +728,58 @@ class TestConnectionManagement:
 
     def test_connection_rollback_on_error(self, db_manager):
         """Test that connection rolls back on error."""
-        try:
+        with pytest.raises(sqlite3.OperationalError):
             with db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment) "
+                    "VALUES ('2024-01-01T12:00:00', 1, 'John', 'Mike', 'Rolled back')"
+                )
                 # This should cause an error
                 cursor.execute("INSERT INTO NonExistentTable VALUES (1)")
-        except Exception:
-            pass  # Expected to fail
 
-        # Database should still be functional
+        # The first insert was rolled back and the database still works
+        assert db_manager.get_all_points() == []
         with db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
             result = cursor.fetchone()
             assert result[0] == 1
+
+    def test_reads_share_one_connection(self, db_manager):
+        """Test that read queries reuse a single connection."""
+        db_manager.add_point_entries([SAMPLE_ENTRIES[0]])
+        # The first read opens the shared connection
+        db_manager.get_all_points()
+
+        with patch("PledgePoints.sqlutils.sqlite3.connect") as connect:
+            db_manager.get_all_points()
+            db_manager.get_point_by_id(1)
+            db_manager.get_approved_points()
+
+        connect.assert_not_called()
+
+    def test_shared_read_connection_sees_later_writes(self, temp_db, make_db_manager):
+        """Test that reads see rows committed through another manager."""
+        reader = make_db_manager(temp_db)
+        writer = make_db_manager(temp_db)
+        assert reader.get_all_points() == []
+
+        writer.add_point_entries(list(SAMPLE_ENTRIES[:2]))
+        writer.approve_all_pending("Admin")
+
+        assert len(reader.get_approved_points()) == 2
+
+    def test_close_releases_open_connections(self, temp_db):
+        """Test that close() closes the shared read connection and can repeat."""
+        manager = DatabaseManager(temp_db)
+        read_conn = manager.get_read_connection()
+
+        manager.close()
+        manager.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            read_conn.execute("SELECT 1")
+        # A file database can still be used; the next read reconnects
+        assert manager.get_all_points() == []
+        manager.close()
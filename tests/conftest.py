@@ -3,6 +3,7 @@
 import os
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -11,6 +12,13 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _no_dotenv():
+    """Keep load_dotenv from reading a real .env file during the test run."""
+    with patch("config.settings.load_dotenv"):
+        yield
+
+
 @pytest.fixture
 def sample_env_vars(monkeypatch):
     """Fixture to set up test environment variables."""
@@ -19,19 +27,115 @@ def sample_env_vars(monkeypatch):
     monkeypatch.setenv("CHANNEL_ID", "123456789")
 
 
+class CommandRegistry:
+    """Stand-in for ``bot.tree`` that records commands registered on it."""
+
+    def __init__(self):
+        self.by_name = {}
+
+    def command(self, *args, **kwargs):
+        """Mimic ``CommandTree.command`` by recording the decorated callback."""
+        name = kwargs.get("name")
+
+        def decorator(func):
+            self.by_name[name] = func
+            return func
+
+        return decorator
+
+
+@pytest.fixture(scope="session")
+def admin_bot():
+    """Fixture for a mock bot with the admin commands registered once.
+
+    ``admin_bot.tree`` is a CommandRegistry holding the registered callbacks.
+    """
+    from unittest.mock import AsyncMock, Mock
+
+    from commands.admin import setup
+
+    bot = Mock()
+    bot.latency = 0.05
+    bot.close = AsyncMock()
+    bot.tree = CommandRegistry()
+    setup(bot)
+    return bot
+
+
+@pytest.fixture(scope="session")
+def admin_commands(admin_bot):
+    """Fixture mapping admin command names to their registered callbacks."""
+    return admin_bot.tree.by_name
+
+
 @pytest.fixture
-def mock_discord_interaction():
-    """Fixture to create a mock Discord interaction."""
+def make_interaction():
+    """Fixture returning a factory for mock Discord interactions.
+
+    Each call builds a fresh interaction. The mocks are specced against the
+    discord.py classes, so a typo in the code under test raises
+    AttributeError instead of silently fabricating a child mock.
+    """
     from unittest.mock import AsyncMock, Mock
 
-    interaction = Mock()
-    interaction.response = Mock()
-    interaction.response.send_message = AsyncMock()
-    interaction.followup = Mock()
-    interaction.followup.send = AsyncMock()
-    interaction.edit_original_response = AsyncMock()
-    interaction.user = Mock()
-    interaction.user.name = "TestUser"
-    interaction.user.id = 123456789
-
-    return interaction
+    import discord
+
+    def _make():
+        interaction = Mock(spec=discord.Interaction)
+        interaction.response = Mock(spec=discord.InteractionResponse)
+        interaction.response.send_message = AsyncMock()
+        interaction.followup = Mock(spec=discord.Webhook)
+        interaction.followup.send = AsyncMock()
+        interaction.edit_original_response = AsyncMock()
+        interaction.user = Mock(spec=discord.Member)
+        interaction.user.name = "TestUser"
+        interaction.user.id = 123456789
+        interaction.user.roles = []
+        interaction.guild = Mock(spec=discord.Guild)
+        interaction.guild.roles = []
+        return interaction
+
+    return _make
+
+
+@pytest.fixture
+def pledge_roster(monkeypatch):
+    """Fixture to validate pledge names against a fixed test roster.
+
+    The real roster in PledgePoints/constants.py changes every semester, so
+    tests that need specific names to be valid use this one instead.
+    """
+    from PledgePoints import validators
+
+    monkeypatch.setattr(
+        validators, "VALID_PLEDGES", frozenset({"Eli", "Elliot", "John", "Matthew"})
+    )
+    monkeypatch.setattr(
+        validators, "PLEDGE_ALIASES", {"Elliott": "Elliot", "Matt": "Matthew"}
+    )
+    # Drop results cached under the real roster, before and after the test
+    validators.normalize_pledge_name.cache_clear()
+    validators.validate_pledge_name.cache_clear()
+    yield
+    validators.normalize_pledge_name.cache_clear()
+    validators.validate_pledge_name.cache_clear()
+
+
+@pytest.fixture
+def make_db_manager():
+    """Factory for DatabaseManager instances, closed after the test.
+
+    Managers use a private in-memory database unless given a file path.
+    """
+    from PledgePoints.sqlutils import DatabaseManager
+
+    managers = []
+
+    def make(db_file=":memory:"):
+        manager = DatabaseManager(db_file)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
@@ -1,5 +1,6 @@
 """Unit tests for role checking utilities."""
 
+import discord
 import pytest
 from unittest.mock import Mock
 
@@ -9,188 +10,97 @@ from role.role_checking import (
     check_info_systems_role,
 )
 
+INFO_SYSTEMS_ROLE_ID = 1032306248235888762
+
+# Role name -> role ID for every role the tests hand out; None means the
+# check looks the role up by name, so any placeholder ID will do
+ROLE_IDS = {
+    "Executive Board": None,
+    "Brother": None,
+    "Info Systems": INFO_SYSTEMS_ROLE_ID,
+    "Member": None,
+}
+
+# (checker, name of the role it requires) for each role check
+ROLE_CASES = [
+    pytest.param(check_eboard_role, "Executive Board", id="eboard"),
+    pytest.param(check_brother_role, "Brother", id="brother"),
+    pytest.param(check_info_systems_role, "Info Systems", id="infosys"),
+]
+
+
+def make_role(name, role_id=None):
+    """Create a mock Discord role.
+
+    Args:
+        name: Role name.
+        role_id: Role ID, or None for an unrelated placeholder ID.
+
+    Returns:
+        Mock role with ``name`` and ``id`` set.
+    """
+    role = Mock(spec=discord.Role)
+    role.name = name
+    role.id = 999999999 if role_id is None else role_id
+    return role
 
-@pytest.fixture
-def mock_interaction():
-    """Create a mock Discord interaction."""
-    interaction = Mock()
-    interaction.guild = Mock()
-    interaction.user = Mock()
-    interaction.user.roles = []
-    return interaction
 
+@pytest.fixture(scope="module")
+def roles():
+    """Read-only mock roles shared by the module, keyed by role name."""
+    return {name: make_role(name, role_id) for name, role_id in ROLE_IDS.items()}
 
-@pytest.fixture
-def mock_eboard_role():
-    """Create a mock Executive Board role."""
-    role = Mock()
-    role.name = "Executive Board"
-    return role
 
+@pytest.mark.parametrize("checker,role_name", ROLE_CASES)
+async def test_user_has_role(make_interaction, roles, checker, role_name):
+    """Test that the check returns True when the user has the role."""
+    interaction = make_interaction()
+    role = roles[role_name]
+    interaction.user.roles = [role]
+    interaction.guild.roles = [role]
 
-@pytest.fixture
-def mock_brother_role():
-    """Create a mock Brother role."""
-    role = Mock()
-    role.name = "Brother"
-    return role
+    assert await checker(interaction) is True
 
 
-@pytest.fixture
-def mock_info_systems_role():
-    """Create a mock Info Systems role."""
-    role = Mock()
-    role.id = 1032306248235888762
-    role.name = "Info Systems"
-    return role
+@pytest.mark.parametrize("checker,role_name", ROLE_CASES)
+async def test_user_without_role(make_interaction, roles, checker, role_name):
+    """Test that the check returns False when the user lacks the role."""
+    interaction = make_interaction()
+    other_role = roles["Member"]
+    interaction.user.roles = [other_role]
+    interaction.guild.roles = [other_role]
+
+    assert await checker(interaction) is False
+
 
+@pytest.mark.parametrize("checker,role_name", ROLE_CASES)
+async def test_role_missing_from_guild(make_interaction, checker, role_name):
+    """Test that the check returns False when the guild has no such role."""
+    interaction = make_interaction()
 
-class TestCheckEboardRole:
-    """Tests for check_eboard_role function."""
-
-    @pytest.mark.asyncio
-    async def test_user_has_eboard_role(self, mock_interaction, mock_eboard_role):
-        """Test that function returns True when user has Executive Board role."""
-        mock_interaction.user.roles = [mock_eboard_role]
-        mock_interaction.guild.roles = [mock_eboard_role]
-
-        result = await check_eboard_role(mock_interaction)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_user_without_eboard_role(self, mock_interaction):
-        """Test that function returns False when user doesn't have Executive Board role."""
-        other_role = Mock()
-        other_role.name = "Member"
-        mock_interaction.user.roles = [other_role]
-        mock_interaction.guild.roles = [other_role]
-
-        result = await check_eboard_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_eboard_role_does_not_exist(self, mock_interaction):
-        """Test that function returns False when Executive Board role doesn't exist in guild."""
-        mock_interaction.guild.roles = []
-
-        result = await check_eboard_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_user_has_multiple_roles_including_eboard(
-        self, mock_interaction, mock_eboard_role
-    ):
-        """Test that function returns True when user has multiple roles including Executive Board."""
-        other_role = Mock()
-        other_role.name = "Member"
-        mock_interaction.user.roles = [other_role, mock_eboard_role]
-        mock_interaction.guild.roles = [other_role, mock_eboard_role]
-
-        result = await check_eboard_role(mock_interaction)
-        assert result is True
-
-
-class TestCheckBrotherRole:
-    """Tests for check_brother_role function."""
-
-    @pytest.mark.asyncio
-    async def test_user_has_brother_role(self, mock_interaction, mock_brother_role):
-        """Test that function returns True when user has Brother role."""
-        mock_interaction.user.roles = [mock_brother_role]
-        mock_interaction.guild.roles = [mock_brother_role]
-
-        result = await check_brother_role(mock_interaction)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_user_without_brother_role(self, mock_interaction):
-        """Test that function returns False when user doesn't have Brother role."""
-        other_role = Mock()
-        other_role.name = "Guest"
-        mock_interaction.user.roles = [other_role]
-        mock_interaction.guild.roles = [other_role]
-
-        result = await check_brother_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_brother_role_does_not_exist(self, mock_interaction):
-        """Test that function returns False when Brother role doesn't exist in guild."""
-        mock_interaction.guild.roles = []
-
-        result = await check_brother_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_user_has_multiple_roles_including_brother(
-        self, mock_interaction, mock_brother_role
-    ):
-        """Test that function returns True when user has multiple roles including Brother."""
-        other_role = Mock()
-        other_role.name = "Member"
-        mock_interaction.user.roles = [other_role, mock_brother_role]
-        mock_interaction.guild.roles = [other_role, mock_brother_role]
-
-        result = await check_brother_role(mock_interaction)
-        assert result is True
-
-
-class TestCheckInfoSystemsRole:
-    """Tests for check_info_systems_role function."""
-
-    @pytest.mark.asyncio
-    async def test_user_has_info_systems_role(
-        self, mock_interaction, mock_info_systems_role
-    ):
-        """Test that function returns True when user has Info Systems role."""
-        mock_interaction.user.roles = [mock_info_systems_role]
-        mock_interaction.guild.roles = [mock_info_systems_role]
-
-        result = await check_info_systems_role(mock_interaction)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_user_without_info_systems_role(self, mock_interaction):
-        """Test that function returns False when user doesn't have Info Systems role."""
-        other_role = Mock()
-        other_role.id = 999999999
-        other_role.name = "Member"
-        mock_interaction.user.roles = [other_role]
-        mock_interaction.guild.roles = [other_role]
-
-        result = await check_info_systems_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_info_systems_role_does_not_exist(self, mock_interaction):
-        """Test that function returns False when Info Systems role doesn't exist in guild."""
-        mock_interaction.guild.roles = []
-
-        result = await check_info_systems_role(mock_interaction)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_user_has_multiple_roles_including_info_systems(
-        self, mock_interaction, mock_info_systems_role
-    ):
-        """Test that function returns True when user has multiple roles including Info Systems."""
-        other_role = Mock()
-        other_role.id = 999999999
-        other_role.name = "Member"
-        mock_interaction.user.roles = [other_role, mock_info_systems_role]
-        mock_interaction.guild.roles = [other_role, mock_info_systems_role]
-
-        result = await check_info_systems_role(mock_interaction)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_role_with_wrong_id(self, mock_interaction):
-        """Test that function returns False when role has wrong ID."""
-        wrong_role = Mock()
-        wrong_role.id = 123456789
-        wrong_role.name = "Info Systems"
-        mock_interaction.user.roles = [wrong_role]
-        mock_interaction.guild.roles = [wrong_role]
-
-        result = await check_info_systems_role(mock_interaction)
-        assert result is False
+    assert await checker(interaction) is False
+
+
+@pytest.mark.parametrize("checker,role_name", ROLE_CASES)
+async def test_multiple_roles(make_interaction, roles, checker, role_name):
+    """Test that the check returns True when the role is among several."""
+    interaction = make_interaction()
+    other_role = roles["Member"]
+    role = roles[role_name]
+    interaction.user.roles = [other_role, role]
+    interaction.guild.roles = [other_role, role]
+
+    assert await checker(interaction) is True
+
+
+@pytest.mark.parametrize(
+    "role_id,expected", [(INFO_SYSTEMS_ROLE_ID, True), (123456789, False)]
+)
+async def test_info_systems_role_matched_by_id(make_interaction, role_id, expected):
+    """Test that the Info Systems role is looked up by ID, not by name."""
+    interaction = make_interaction()
+    role = make_role("Info Systems", role_id)
+    interaction.user.roles = [role]
+    interaction.guild.roles = [role]
+
+    assert await check_info_systems_role(interaction) is expected
@@ -1,15 +1,15 @@
 """Unit tests for Discord helper utilities."""
 
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 
 import pytest
-from unittest.mock import AsyncMock, Mock
 
 from utils.discord_helpers import (
     format_approval_status,
     format_approval_confirmation,
     format_pending_reset_confirmation,
-    format_pending_points_list,
+    format_pending_points_embeds,
     format_point_entry_detailed,
     format_point_entry_summary,
     format_rankings_text,
@@ -17,272 +17,263 @@ from utils.discord_helpers import (
 )
 from PledgePoints.models import PointEntry
 
+_T0 = datetime(2025, 1, 1, 12, 0, 0)
 
-class TestSendChunkedMessage:
-    """Tests for send_chunked_message function."""
 
-    @pytest.mark.asyncio
-    async def test_short_message_single_send(self, mock_discord_interaction):
-        """Test that short messages are sent as a single message."""
-        short_message = "This is a short message"
+@pytest.fixture(scope="module")
+def base_entry():
+    """Pending point entry shared read-only by the formatting tests."""
+    return PointEntry(
+        entry_id=1,
+        time=_T0,
+        brother="John",
+        point_change=10,
+        pledge="Jake",
+        comment="Good",
+    )
 
-        await send_chunked_message(mock_discord_interaction, short_message)
 
-        mock_discord_interaction.followup.send.assert_called_once_with(short_message)
+@pytest.fixture(scope="module")
+def payloads():
+    """Message payloads of various lengths, keyed by length."""
+    return {n: "A" * n for n in (999, 1000, 1001, 2500, 3800)}
 
-    @pytest.mark.asyncio
-    async def test_long_message_chunked(self, mock_discord_interaction):
-        """Test that long messages are split into chunks."""
-        long_message = "A" * 2500  # Exceeds default chunk size of 1900
 
-        await send_chunked_message(
-            mock_discord_interaction, long_message, chunk_size=1000
-        )
+async def test_short_message_single_send(make_interaction):
+    """Test that short messages are sent as a single message."""
+    interaction = make_interaction()
+    short_message = "This is a short message"
 
-        # Should be called 3 times (2500 chars / 1000 chunk_size = 3 chunks)
-        assert mock_discord_interaction.followup.send.call_count == 3
+    await send_chunked_message(interaction, short_message)
 
+    interaction.followup.send.assert_awaited_once_with(short_message)
 
-class TestFormatApprovalStatus:
-    """Tests for format_approval_status function."""
 
-    def test_approved_status(self):
-        """Test formatting of approved status."""
-        entry = PointEntry(
-            entry_id=1,
-            time=datetime.now(),
-            brother="John",
-            point_change=10,
-            pledge="Jake",
-            comment="Great work",
-            approval_status="approved",
-            approved_by="Admin",
-            approval_timestamp=datetime(2025, 1, 1, 12, 0, 0),
-        )
+@pytest.mark.parametrize(
+    "length,chunk,expected_calls",
+    [
+        (999, 1000, 1),
+        (1000, 1000, 1),
+        (1001, 1000, 2),
+        (2500, 1000, 3),
+        (3800, 1900, 2),
+    ],
+)
+async def test_chunking(make_interaction, payloads, length, chunk, expected_calls):
+    """Test that messages are split into the expected number of chunks."""
+    interaction = make_interaction()
+    message = payloads[length]
 
-        result = format_approval_status(entry)
+    await send_chunked_message(interaction, message, chunk_size=chunk)
+
+    send = interaction.followup.send
+    assert send.await_count == expected_calls
+    assert "".join(call.args[0] for call in send.await_args_list) == message
+
+
+async def test_long_text_sent_as_attachment(make_interaction):
+    """Test that text needing more than max_chunks messages becomes a file."""
+    interaction = make_interaction()
+    text = "A" * 1050
+
+    await send_chunked_message(interaction, text, chunk_size=100, max_chunks=5)
+
+    interaction.followup.send.assert_awaited_once()
+    attachment = interaction.followup.send.await_args.kwargs["file"]
+    assert attachment.filename == "output.txt"
+    assert attachment.fp.read() == text.encode("utf-8")
 
-        assert "✅" in result
-        assert "Approved" in result
-        assert "Admin" in result
-        assert "2025-01-01" in result
 
-    def test_rejected_status(self):
-        """Test formatting of rejected status."""
-        entry = PointEntry(
-            entry_id=1,
-            time=datetime.now(),
-            brother="John",
-            point_change=10,
-            pledge="Jake",
-            comment="Great work",
-            approval_status="rejected",
-            approved_by="Admin",
-            approval_timestamp=datetime(2025, 1, 1, 12, 0, 0),
-        )
-
-        result = format_approval_status(entry)
-
-        assert "❌" in result
-        assert "Rejected" in result
-        assert "Admin" in result
-
-    def test_pending_status(self):
-        """Test formatting of pending status."""
-        entry = PointEntry(
-            entry_id=1,
-            time=datetime.now(),
-            brother="John",
-            point_change=10,
-            pledge="Jake",
-            comment="Great work",
-            approval_status="pending",
-        )
-
-        result = format_approval_status(entry)
-
-        assert "⏳" in result
-        assert "Pending" in result
-
-
-class TestFormatPointEntrySummary:
-    """Tests for format_point_entry_summary function."""
-
-    def test_summary_formatting(self):
-        """Test basic summary formatting."""
-        entry = PointEntry(
-            entry_id=42,
-            time=datetime.now(),
-            brother="John",
-            point_change=10,
-            pledge="Jake",
-            comment="Great work",
-        )
-
-        result = format_point_entry_summary(entry)
-
-        assert "ID 42" in result
-        assert "John" in result
-        assert "Jake" in result
-        assert "+10" in result
-
-
-class TestFormatPointEntryDetailed:
-    """Tests for format_point_entry_detailed function."""
-
-    def test_detailed_formatting(self):
-        """Test detailed entry formatting."""
-        entry = PointEntry(
-            entry_id=42,
-            time=datetime(2025, 1, 1, 12, 0, 0),
-            brother="John",
-            point_change=10,
-            pledge="Jake",
-            comment="Great work",
-            approval_status="approved",
-            approved_by="Admin",
-        )
-
-        result = format_point_entry_detailed(entry)
-
-        assert "ID: 42" in result
-        assert "John" in result
-        assert "Jake" in result
-        assert "+10" in result
-        assert "Great work" in result
+@pytest.mark.parametrize(
+    "status,approved_by,icon,label",
+    [
+        ("approved", "Admin", "✅", "Approved"),
+        ("rejected", "Admin", "❌", "Rejected"),
+        ("pending", None, "⏳", "Pending"),
+    ],
+)
+def test_format_approval_status(base_entry, status, approved_by, icon, label):
+    """Test formatting of each approval status."""
+    entry = replace(
+        base_entry,
+        approval_status=status,
+        approved_by=approved_by,
+        approval_timestamp=_T0 if approved_by else None,
+    )
+
+    result = format_approval_status(entry)
+
+    assert icon in result
+    assert label in result
+    if approved_by:
+        assert approved_by in result
         assert "2025-01-01" in result
 
 
-class TestFormatRankingsText:
-    """Tests for format_rankings_text function."""
-
-    def test_empty_rankings(self):
-        """Test handling of empty rankings."""
-        result = format_rankings_text([])
-
-        assert "No rankings data available" in result
-
-    def test_rankings_with_medals(self):
-        """Test that top 3 get medal emojis."""
-        rankings = [
-            ("Jake", 100),
-            ("John", 80),
-            ("Mike", 60),
-            ("Tom", 40),
-        ]
-
-        result = format_rankings_text(rankings)
-
-        assert "🥇" in result  # 1st place
-        assert "🥈" in result  # 2nd place
-        assert "🥉" in result  # 3rd place
-        assert "4." in result  # 4th place numbered
-        assert "Jake" in result
-        assert "100" in result
-
-
-class TestFormatPendingPointsList:
-    """Tests for format_pending_points_list function."""
-
-    def test_empty_pending_list(self):
-        """Test handling of empty pending points."""
-        result = format_pending_points_list([])
-
-        assert "No pending points found" in result
-
-    def test_pending_list_formatting(self):
-        """Test formatting of pending points list."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
-                approval_status="pending",
-            ),
-        ]
-
-        result = format_pending_points_list(entries)
-
-        assert "Pending Point Submissions" in result
-        assert "ID: 1" in result
-
-
-class TestFormatApprovalConfirmation:
-    """Tests for format_approval_confirmation function."""
-
-    def test_approval_confirmation(self):
-        """Test approval confirmation message."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
-            ),
-        ]
-
-        result = format_approval_confirmation(entries, approved=True)
-
-        assert "✅" in result
-        assert "Approved" in result
-        assert "1 point submission" in result
-
-    def test_rejection_confirmation(self):
-        """Test rejection confirmation message."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
-            ),
-        ]
-
-        result = format_approval_confirmation(entries, approved=False)
-
-        assert "❌" in result
-        assert "Rejected" in result
-
-
-class TestFormatPendingResetConfirmation:
-    """Tests for format_pending_reset_confirmation function."""
-
-    def test_reset_confirmation(self):
-        """Test formatting when entries are moved back to pending."""
-        entries = [
-            PointEntry(
-                entry_id=3,
-                time=datetime.now(),
-                brother="Sam",
-                point_change=7,
-                pledge="Alex",
-                comment="Recheck this",
-            ),
-            PointEntry(
-                entry_id=4,
-                time=datetime.now(),
-                brother="Luke",
-                point_change=5,
-                pledge="Pat",
-                comment="Needs review",
-            ),
-        ]
-
-        result = format_pending_reset_confirmation(entries)
-
-        assert "Moved 2 submission(s)" in result
-        assert "ID 3" in result
-        assert "ID 4" in result
-
-    def test_empty_reset_confirmation(self):
-        """Test handling of empty entry list."""
-        result = format_pending_reset_confirmation([])
-
-        assert "No entries moved to pending" in result
+def test_summary_formatting(base_entry):
+    """Test basic summary formatting."""
+    entry = replace(base_entry, entry_id=42)
+
+    result = format_point_entry_summary(entry)
+
+    assert "ID 42" in result
+    assert "John" in result
+    assert "Jake" in result
+    assert "+10" in result
+
+
+def test_detailed_formatting(base_entry):
+    """Test detailed entry formatting."""
+    entry = replace(
+        base_entry, entry_id=42, approval_status="approved", approved_by="Admin"
+    )
+
+    result = format_point_entry_detailed(entry)
+
+    assert "ID: 42" in result
+    assert "John" in result
+    assert "Jake" in result
+    assert "+10" in result
+    assert "Good" in result
+    assert "2025-01-01" in result
+
+
+def test_detailed_formatting_same_instant_in_two_zones(base_entry):
+    """Test that equal aware times in different zones show their own wall clock."""
+    utc_time = datetime(2025, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+    central_time = utc_time.astimezone(timezone(timedelta(hours=-6)))
+
+    utc_result = format_point_entry_detailed(replace(base_entry, time=utc_time))
+    central_result = format_point_entry_detailed(replace(base_entry, time=central_time))
+
+    assert "2025-01-01 18:00:00" in utc_result
+    assert "2025-01-01 12:00:00" in central_result
+
+
+def test_rankings_with_medals():
+    """Test that top 3 get medal emojis."""
+    rankings = [
+        ("Jake", 100),
+        ("John", 80),
+        ("Mike", 60),
+        ("Tom", 40),
+    ]
+
+    result = format_rankings_text(rankings)
+
+    assert "🥇" in result  # 1st place
+    assert "🥈" in result  # 2nd place
+    assert "🥉" in result  # 3rd place
+    assert "4." in result  # 4th place numbered
+    assert "Jake" in result
+    assert "100" in result
+
+
+@pytest.mark.parametrize("totals", [(5, 5.0), (5.0, 5)])
+def test_rankings_totals_formatted_as_integers(totals):
+    """Test that numerically equal totals of any type show the same text."""
+    for total in totals:
+        assert "**Jake**: 5 points" in format_rankings_text([("Jake", total)])
+
+
+def test_pending_embeds_one_field_per_entry(base_entry):
+    """Test that each pending entry becomes one embed field."""
+    entries = [replace(base_entry, entry_id=i) for i in range(1, 4)]
+
+    embeds = format_pending_points_embeds(entries)
+
+    assert len(embeds) == 1
+    assert [field.name for field in embeds[0].fields] == [
+        "ID 1: John → Jake (+10)",
+        "ID 2: John → Jake (+10)",
+        "ID 3: John → Jake (+10)",
+    ]
+    assert "Good" in embeds[0].fields[0].value
+
+
+def test_pending_embeds_split_at_field_limit(base_entry):
+    """Test that entries past 25 fields continue in another embed."""
+    entries = [replace(base_entry, entry_id=i) for i in range(30)]
+
+    embeds = format_pending_points_embeds(entries)
+
+    assert [len(embed.fields) for embed in embeds] == [25, 5]
+    assert embeds[1].title.endswith("(continued)")
+
+
+def test_pending_embeds_split_at_length_limit(base_entry):
+    """Test that long comments are cut to fit and spread across embeds."""
+    entries = [replace(base_entry, entry_id=i, comment="x" * 2000) for i in range(8)]
+
+    embeds = format_pending_points_embeds(entries)
+
+    assert len(embeds) > 1
+    assert all(len(embed) <= 6000 for embed in embeds)
+    assert all(len(f.value) <= 1024 for embed in embeds for f in embed.fields)
+
+
+def test_pending_embeds_limit(base_entry):
+    """Test that entries past the limit are counted in the footer."""
+    entries = [replace(base_entry, entry_id=i) for i in range(5)]
+
+    embeds = format_pending_points_embeds(entries, limit=3)
+
+    assert len(embeds[-1].fields) == 3
+    assert "2 more pending entries" in embeds[-1].footer.text
+
+
+def test_approval_confirmation(base_entry):
+    """Test approval confirmation message."""
+    result = format_approval_confirmation([base_entry], approved=True)
+
+    assert "✅" in result
+    assert "Approved" in result
+    assert "1 point submission" in result
+
+
+def test_rejection_confirmation(base_entry):
+    """Test rejection confirmation message."""
+    result = format_approval_confirmation([base_entry], approved=False)
+
+    assert "❌" in result
+    assert "Rejected" in result
+
+
+def test_reset_confirmation():
+    """Test formatting when entries are moved back to pending."""
+    entries = [
+        PointEntry(
+            entry_id=3,
+            time=_T0,
+            brother="Sam",
+            point_change=7,
+            pledge="Alex",
+            comment="Recheck this",
+        ),
+        PointEntry(
+            entry_id=4,
+            time=_T0,
+            brother="Luke",
+            point_change=5,
+            pledge="Pat",
+            comment="Needs review",
+        ),
+    ]
+
+    result = format_pending_reset_confirmation(entries)
+
+    assert "Moved 2 submission(s)" in result
+    assert "ID 3" in result
+    assert "ID 4" in result
+
+
+@pytest.mark.parametrize(
+    "formatter,expected",
+    [
+        (format_rankings_text, "No rankings data available"),
+        (format_pending_reset_confirmation, "No entries moved to pending"),
+    ],
+)
+def test_empty_formatter(formatter, expected):
+    """Test that formatters report an empty input instead of a bare header."""
+    assert expected in formatter([])
@@ -7,38 +7,93 @@ such as chunking long messages, formatting responses, and handling embeds.
 Author: Warner (with AI assistance)
 """
 
+import io
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
 import discord
 
-from PledgePoints.constants import DISCORD_MESSAGE_SAFE_LENGTH, RANK_MEDALS
+from PledgePoints.constants import (
+    DISCORD_EMBED_FIELD_NAME_MAX_LENGTH,
+    DISCORD_EMBED_FIELD_VALUE_MAX_LENGTH,
+    DISCORD_EMBED_MAX_FIELDS,
+    DISCORD_EMBED_MAX_LENGTH,
+    DISCORD_MAX_MESSAGE_CHUNKS,
+    DISCORD_MESSAGE_SAFE_LENGTH,
+    PENDING_LIST_LIMIT,
+    RANK_MEDALS,
+)
 from PledgePoints.models import PointEntry
 
+# Timestamp format shared by every formatter that shows a date and time
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Display label for each decided approval status; anything else is pending
+_STATUS_LABELS = {
+    "approved": "✅ **Approved**",
+    "rejected": "❌ **Rejected**",
+}
+
+# Ranking line prefixes: medal emoji for the top ranks, otherwise the rank number
+_RANK_PREFIXES = tuple(RANK_MEDALS.get(i, f"{i}.") for i in range(1, 257))
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp for display as ``YYYY-MM-DD HH:MM:SS``.
+
+    Cached because the same entries are shown again on every pending list
+    or detail view, and bulk approvals share one approval timestamp. Aware
+    datetimes naming the same instant in different zones compare equal, so
+    the cache is keyed on the tzinfo too.
+    """
+    return _format_timestamp_in_zone(timestamp, timestamp.tzinfo)
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp_in_zone(timestamp: datetime, tzinfo) -> str:
+    """Cached body of _format_timestamp; ``tzinfo`` is only part of the key."""
+    return timestamp.strftime(_TS_FMT)
+
 
 async def send_chunked_message(
     interaction: discord.Interaction,
     text: str,
     chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH,
+    max_chunks: int = DISCORD_MAX_MESSAGE_CHUNKS,
 ) -> None:
     """
     Send a long message by splitting it into chunks if necessary.
 
     Discord has a 2000 character limit for messages. This function automatically
-    splits long messages into multiple followup messages if needed.
+    splits long messages into multiple followup messages if needed. Text that
+    would need more than ``max_chunks`` messages is sent instead as a single
+    ``.txt`` attachment, which costs one request and keeps the channel readable.
 
     Args:
         interaction: Discord interaction to send messages through
         text: The full text to send (may exceed Discord's limit)
         chunk_size: Maximum size of each chunk (default: 1900 for safety buffer)
+        max_chunks: Maximum number of messages to split the text into before
+            falling back to an attachment
     """
     if len(text) <= chunk_size:
         await interaction.followup.send(text)
-    else:
-        # Split into chunks
-        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
-        for chunk in chunks:
-            await interaction.followup.send(chunk)
+        return
+
+    if len(text) > max_chunks * chunk_size:
+        await interaction.followup.send(
+            "The response is too long for a message, so it is attached as a file.",
+            file=discord.File(io.BytesIO(text.encode("utf-8")), filename="output.txt"),
+        )
+        return
+
+    # Slice each chunk only when it is about to be sent. Chunks go out one at
+    # a time: followups for an interaction share one webhook rate limit, so
+    # sending them concurrently would not finish sooner and could reorder
+    # the message.
+    for start in range(0, len(text), chunk_size):
+        await interaction.followup.send(text[start : start + chunk_size])
 
 
 def format_approval_status(entry: PointEntry) -> str:
@@ -54,19 +109,15 @@ def format_approval_status(entry: PointEntry) -> str:
     Returns:
         str: Formatted approval status string with emoji
     """
-    if entry.approval_status == "approved":
-        status = f"✅ **Approved** by {entry.approved_by}"
-        if entry.approval_timestamp:
-            status += f" on {entry.approval_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-        return status
-    elif entry.approval_status == "rejected":
-        status = f"❌ **Rejected** by {entry.approved_by}"
-        if entry.approval_timestamp:
-            status += f" on {entry.approval_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-        return status
-    else:
+    label = _STATUS_LABELS.get(entry.approval_status)
+    if label is None:
         return "⏳ **Pending Approval**"
 
+    status = f"{label} by {entry.approved_by}"
+    if entry.approval_timestamp:
+        status += f" on {_format_timestamp(entry.approval_timestamp)}"
+    return status
+
 
 def format_point_entry_summary(entry: PointEntry) -> str:
     """
@@ -94,18 +145,28 @@ def format_point_entry_detailed(entry: PointEntry) -> str:
     Returns:
         str: Multi-line formatted string with all entry details
     """
-    time_formatted = entry.time.strftime("%Y-%m-%d %H:%M:%S")
     approval_info = format_approval_status(entry)
 
-    details = f"**ID: {entry.entry_id}**\n"
-    details += f"⏰ Time: {time_formatted}\n"
-    details += f"👤 Brother: {entry.brother}\n"
-    details += f"📊 Points: {entry.point_change:+d}\n"
-    details += f"🎯 Pledge: {entry.pledge}\n"
-    details += f"💬 Comment: {entry.comment}\n"
-    details += f"🔍 Status: {approval_info}\n"
+    return (
+        f"**ID: {entry.entry_id}**\n"
+        f"⏰ Time: {_format_timestamp(entry.time)}\n"
+        f"👤 Brother: {entry.brother}\n"
+        f"📊 Points: {entry.point_change:+d}\n"
+        f"🎯 Pledge: {entry.pledge}\n"
+        f"💬 Comment: {entry.comment}\n"
+        f"🔍 Status: {approval_info}\n"
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_points(total_points: int) -> str:
+    """Format a point total with thousands separators, e.g. ``1,250``.
 
-    return details
+    Cached because point totals repeat a lot across pledges and calls, and the
+    grouping path of int.__format__ is comparatively slow. Callers pass an
+    int, since equal totals of other types (5 and 5.0) would share an entry.
+    """
+    return f"{total_points:,}"
 
 
 def format_rankings_text(rankings: List[tuple[str, int]]) -> str:
@@ -121,35 +182,80 @@ def format_rankings_text(rankings: List[tuple[str, int]]) -> str:
     if not rankings:
         return "No rankings data available."
 
-    text = "🏆 **Pledge Rankings by Total Points**\n\n"
-
-    for i, (pledge, total_points) in enumerate(rankings, 1):
-        # Add medal emoji for top 3, otherwise use number
-        medal = RANK_MEDALS.get(i, f"{i}.")
-        text += f"{medal} **{pledge}**: {total_points:,} points\n"
+    prefixes = _RANK_PREFIXES
+    if len(rankings) > len(prefixes):
+        prefixes += tuple(f"{i}." for i in range(len(prefixes) + 1, len(rankings) + 1))
 
-    return text
+    body = "".join(
+        f"{prefix} **{pledge}**: {_format_points(int(total_points))} points\n"
+        for prefix, (pledge, total_points) in zip(prefixes, rankings)
+    )
+    return f"🏆 **Pledge Rankings by Total Points**\n\n{body}"
 
 
-def format_pending_points_list(entries: List[PointEntry]) -> str:
+def _format_pending_field(entry: PointEntry) -> tuple[str, str]:
     """
-    Format a list of pending point entries for display.
+    Format a pending point entry as an embed field, trimmed to Discord's limits.
+
+    Every entry on the pending list is pending, so the field leaves out the
+    approval status instead of looking it up.
 
     Args:
-        entries: List of pending point entries
+        entry: Pending point entry to format
 
     Returns:
-        str: Formatted list of pending points with details
+        tuple[str, str]: (field name, field value)
     """
-    if not entries:
-        return "No pending points found."
+    name = (
+        f"ID {entry.entry_id}: {entry.brother} → {entry.pledge} "
+        f"({entry.point_change:+d})"
+    )
+    value = f"⏰ {_format_timestamp(entry.time)}\n💬 {entry.comment}"
+    return (
+        name[:DISCORD_EMBED_FIELD_NAME_MAX_LENGTH],
+        value[:DISCORD_EMBED_FIELD_VALUE_MAX_LENGTH],
+    )
+
+
+def format_pending_points_embeds(
+    entries: List[PointEntry], limit: int = PENDING_LIST_LIMIT
+) -> List[discord.Embed]:
+    """
+    Format pending point entries as Discord embeds, one field per entry.
 
-    text = "📋 **Pending Point Submissions**\n\n"
+    Entries are spread over as many embeds as Discord's field and length
+    limits require. Only the first ``limit`` entries are shown; the rest are
+    counted in the footer of the last embed.
 
-    for entry in entries:
-        text += format_point_entry_detailed(entry) + "\n"
+    Args:
+        entries: List of pending point entries
+        limit: Maximum number of entries to show
 
-    return text
+    Returns:
+        List[discord.Embed]: Embeds to send, in order (empty if no entries)
+    """
+    embeds: List[discord.Embed] = []
+    embed = None
+
+    for name, value in map(_format_pending_field, entries[:limit]):
+        # Start a new embed when this field would not fit, leaving room for
+        # the footer on the last one
+        if (
+            embed is None
+            or len(embed.fields) == DISCORD_EMBED_MAX_FIELDS
+            or len(embed) + len(name) + len(value) > DISCORD_EMBED_MAX_LENGTH - 100
+        ):
+            title = "📋 Pending Point Submissions"
+            if embeds:
+                title += " (continued)"
+            embed = discord.Embed(title=title)
+            embeds.append(embed)
+        embed.add_field(name=name, value=value, inline=False)
+
+    if embed is not None and len(entries) > limit:
+        embed.set_footer(text=f"… and {len(entries) - limit} more pending entries.")
+
+    return embeds
 
 
 def format_approval_confirmation(
@@ -171,12 +277,9 @@ def format_approval_confirmation(
     action = "Approved" if approved else "Rejected"
     emoji = "✅" if approved else "❌"
 
-    text = f"{emoji} **{action} {len(entries)} point submission(s):**\n\n"
-
-    for entry in entries:
-        text += format_point_entry_summary(entry) + "\n"
-
-    return text
+    header = f"{emoji} **{action} {len(entries)} point submission(s):**\n\n"
+    body = "\n".join(map(format_point_entry_summary, entries))
+    return f"{header}{body}\n"
 
 
 def format_pending_reset_confirmation(entries: List[PointEntry]) -> str:
@@ -192,9 +295,6 @@ def format_pending_reset_confirmation(entries: List[PointEntry]) -> str:
     if not entries:
         return "No entries moved to pending."
 
-    text = f"♻️ **Moved {len(entries)} submission(s) back to pending:**\n\n"
-
-    for entry in entries:
-        text += format_point_entry_summary(entry) + "\n"
-
-    return text
+    header = f"♻️ **Moved {len(entries)} submission(s) back to pending:**\n\n"
+    body = "\n".join(map(format_point_entry_summary, entries))
+    return f"{header}{body}\n"